@@ -4,49 +4,118 @@ Uses LSTM for time series prediction and XGBoost for classification.
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd
 import pickle
+import json
 import os
-from typing import List, Dict, Optional
+import copy
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Optional, Sequence, Tuple
+import tensorflow as tf
 from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.optimizers import Adam
-from xgboost import XGBClassifier
+from xgboost import XGBClassifier, build_info
 from sklearn.preprocessing import MinMaxScaler
 from vehicle_sim import VehicleSimulator
 
+# ONNX Runtime (optional, lower per-call overhead for LSTM inference).
+# Set ENABLE_ONNX_LSTM=false to skip the tf2onnx conversion even when installed.
+try:
+    import onnxruntime as ort
+    import tf2onnx
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+    ort = None
+    tf2onnx = None
+
 # Path to save trained models
 MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
 LSTM_MODEL_PATH = os.path.join(MODEL_DIR, "trained_lstm_model.keras")
 XGB_MODEL_PATH = os.path.join(MODEL_DIR, "trained_xgb_model.pkl")
 SCALER_PATH = os.path.join(MODEL_DIR, "trained_scaler.pkl")
+MODEL_META_PATH = os.path.join(MODEL_DIR, "trained_model_meta.json")
+
+# Bump when the feature layout or model architecture changes, so models saved
+# by an older version are retrained instead of loaded
+MODEL_VERSION = 1
+
+# Whether this XGBoost build can train on a CUDA device. CPU-only wheels
+# cannot, even on a machine where TensorFlow sees a GPU.
+XGB_CUDA_AVAILABLE = bool(build_info().get("USE_CUDA"))
+
+# Length of the XGBoost feature vector: raw (5) + LSTM prediction (5) + error (5)
+# + |error| (5) + error^2 (5) + thresholds (10) + history mean/std/max/min/delta (25)
+N_CLASSIFICATION_FEATURES = 60
+
+# Threshold indicators (features 25-32) as one vectorized comparison. Each entry
+# is the raw feature index, +1 for "above the limit" or -1 for "below the limit",
+# and the limit itself: temp warning/critical, vibration warning/critical,
+# low/high battery voltage, high/low RPM
+_INDICATOR_IDX = np.array([1, 1, 2, 2, 4, 4, 0, 0])
+_INDICATOR_SIGN = np.array([1, 1, 1, 1, -1, 1, 1, -1], dtype=np.float32)
+_INDICATOR_LIMIT = _INDICATOR_SIGN * np.array(
+    [105, 120, 0.4, 1.0, 13.5, 14.5, 3000, 800], dtype=np.float32
+)
+
+# Excess temperature and vibration over their warning thresholds (features 33-34)
+_EXCESS_IDX = np.array([1, 2])
+_EXCESS_LIMIT = np.array([105, 0.4], dtype=np.float32)
 
 
 class AnomalyDetector:
     """Hybrid LSTM + XGBoost anomaly detector for vehicle telemetry."""
     
-    def __init__(self, sequence_length: int = 10, contamination: float = 0.01):
+    # Bump when the detector's attributes or methods change, so instances kept
+    # in a live Streamlit session are recreated instead of reused
+    VERSION = 6
+    
+    def __init__(self, sequence_length: int = 10, contamination: float = 0.01,
+                 n_estimators: int = 200, max_depth: int = 8, learning_rate: float = 0.05,
+                 quantize_lstm: bool = False):
         """
         Initialize the anomaly detector.
         
         Args:
             sequence_length: Number of previous readings to use for LSTM prediction
             contamination: Expected proportion of anomalies (0.0 to 0.5)
+            n_estimators: Number of XGBoost trees (per-reading scoring cost is linear in this)
+            max_depth: Maximum depth of each XGBoost tree
+            learning_rate: XGBoost learning rate. Pass n_estimators=100, max_depth=6,
+                learning_rate=0.1 for a smaller ensemble with half the trees to traverse per reading
+            quantize_lstm: Run per-reading LSTM inference on an int8-weight TFLite
+                copy of the model (smaller and faster, slightly less precise)
         """
         self.sequence_length = sequence_length
         self.contamination = contamination
+        self.n_estimators = n_estimators
+        self.max_depth = max_depth
+        self.learning_rate = learning_rate
+        self.quantize_lstm = quantize_lstm
         
         # LSTM model for time series prediction
         self.lstm_model: Optional[Sequential] = None
+        self._lstm_infer = None  # Traced forward pass, see _compile_lstm_inference()
+        self._ort_session = None  # ONNX Runtime session, when available
+        self._ort_input = None
+        self._tflite = None  # Quantized TFLite interpreter, when quantize_lstm is set
+        self._tflite_input = None
+        self._tflite_output = None
         
         # XGBoost model for classification
         self.xgb_model: Optional[XGBClassifier] = None
+        self._booster = None  # Underlying Booster, see _anomaly_probabilities()
         
         # Scaler for normalizing features
         self.scaler = MinMaxScaler()
+        self._sc_scale: Optional[np.ndarray] = None  # See _cache_scaler_params()
+        self._sc_min: Optional[np.ndarray] = None
         
-        # History buffer for maintaining sequences
-        self.reading_history: List[Dict] = []
+        # History buffer for maintaining sequences (oldest readings drop off automatically)
+        self.reading_history: deque = deque(maxlen=50)
         
         self.is_trained = False
         self.feature_names = [
@@ -57,6 +126,24 @@ class AnomalyDetector:
             "battery_voltage_v"
         ]
         
+        # Scratch buffer reused by _extract_features on every tick. float32 matches
+        # what Keras and XGBoost compute in, so no upcast copy is made per call.
+        self._feat_buf = np.empty(5, dtype=np.float32)
+        self._xgb_feat = np.empty(N_CLASSIFICATION_FEATURES, dtype=np.float32)
+        
+        # Rolling window of the last 5 raw feature vectors (a ring buffer) used
+        # for the history statistics, so they are not re-extracted every tick
+        self._recent_raw = np.zeros((5, 5), dtype=np.float32)
+        self._recent_idx = 0
+        self._recent_len = 0
+        
+        # Scaled feature vectors of reading_history, oldest first, so the LSTM
+        # input is a slice rather than a rebuild. Twice the history length so
+        # rows are only shifted back to the front once every 50 appends and the
+        # last sequence_length rows are always contiguous.
+        self._scaled_history = np.zeros((100, 5), dtype=np.float32)
+        self._sh_len = 0
+        
         # Try to load existing models on initialization
         self._load_models()
     
@@ -74,6 +161,10 @@ class AnomalyDetector:
                 with open(SCALER_PATH, 'wb') as f:
                     pickle.dump(self.scaler, f)
                 
+                # Save the settings the models were trained with
+                with open(MODEL_META_PATH, 'w') as f:
+                    json.dump(self._model_settings(), f)
+                
                 print("Models saved to disk.")
             except Exception as e:
                 print(f"Error saving models: {e}")
@@ -85,16 +176,32 @@ class AnomalyDetector:
                 os.path.exists(XGB_MODEL_PATH) and 
                 os.path.exists(SCALER_PATH)):
                 
+                # Models without metadata, or trained with other settings, are retrained
+                meta = None
+                if os.path.exists(MODEL_META_PATH):
+                    with open(MODEL_META_PATH, 'r') as f:
+                        meta = json.load(f)
+                if meta != self._model_settings():
+                    print("Saved models are out of date; they will be retrained.")
+                    return False
+                
                 # Load LSTM model
                 self.lstm_model = load_model(LSTM_MODEL_PATH)
+                self._compile_lstm_inference()
                 
                 # Load XGBoost model
                 with open(XGB_MODEL_PATH, 'rb') as f:
                     self.xgb_model = pickle.load(f)
                 
+                # A pickled model keeps the device it was trained with
+                self.xgb_model.set_params(device="cpu")
+                self._booster = self.xgb_model.get_booster()
+                
                 # Load scaler
                 with open(SCALER_PATH, 'rb') as f:
                     self.scaler = pickle.load(f)
+                self._cache_scaler_params()
+                self._reset_feature_buffers()
                 
                 self.is_trained = True
                 print("Loaded trained models from disk.")
@@ -104,37 +211,195 @@ class AnomalyDetector:
         
         return False
     
-    def sync_history(self, readings: List[Dict]):
+    def _model_settings(self) -> dict:
+        """Return the settings saved models must match to be loaded."""
+        return {
+            "version": MODEL_VERSION,
+            "sequence_length": self.sequence_length,
+            "contamination": self.contamination,
+            "n_estimators": self.n_estimators,
+            "max_depth": self.max_depth,
+            "learning_rate": self.learning_rate,
+        }
+    
+    @classmethod
+    def load_or_train(cls, n_samples: int = 1000, **kwargs) -> "AnomalyDetector":
+        """
+        Create a detector from the saved models, training it only if none are usable.
+        
+        Args:
+            n_samples: Number of normal readings to train on if training is needed
+            **kwargs: Constructor arguments for AnomalyDetector
+            
+        Returns:
+            A trained AnomalyDetector
+        """
+        detector = cls(**kwargs)
+        if not detector.is_trained:
+            detector.train_initial_model(n_samples=n_samples)
+        return detector
+    
+    def fork(self) -> "AnomalyDetector":
+        """
+        Create a detector that shares this one's trained models but has its own history.
+        
+        Lets one loaded or trained set of models serve many independent reading
+        streams (e.g. one per dashboard session) without reloading them.
+        
+        Returns:
+            A new AnomalyDetector with empty history and scratch buffers
+        """
+        clone = copy.copy(self)
+        clone.reading_history = deque(maxlen=50)
+        clone._feat_buf = np.empty_like(self._feat_buf)
+        clone._xgb_feat = np.empty_like(self._xgb_feat)
+        clone._recent_raw = np.zeros_like(self._recent_raw)
+        clone._recent_idx = 0
+        clone._recent_len = 0
+        clone._scaled_history = np.zeros_like(self._scaled_history)
+        clone._sh_len = 0
+        
+        # A TFLite interpreter holds its input/output tensors, so it cannot be shared
+        if self._tflite is not None:
+            clone._build_tflite_interpreter()
+        
+        return clone
+    
+    def sync_history(self, readings: Sequence[Dict]):
         """
         Sync the detector's reading history with external readings.
         This ensures the LSTM has access to recent readings for predictions.
         
         Args:
-            readings: List of reading dictionaries to sync from
+            readings: List or deque of reading dictionaries to sync from
         """
         # Update history with the most recent readings
         # Keep at least sequence_length readings if available
-        if readings:
-            self.reading_history = readings[-50:]  # Keep last 50 readings
+        if not readings:
+            return
+        
+        tail = list(islice(readings, max(0, len(readings) - 50), None))  # Keep last 50 readings
+        if self.reading_history:
+            latest = self.reading_history[-1]
+            if tail[-1] is latest:
+                return
+            
+            # If the external list only grew past our latest reading, append the
+            # new ones to the feature buffers instead of rebuilding them
+            for i in range(len(tail) - 2, -1, -1):
+                if tail[i] is latest:
+                    for reading in tail[i + 1:]:
+                        self._append_history(reading)
+                    return
+        
+        self.reading_history = deque(tail, maxlen=50)
+        self._reset_feature_buffers()
     
-    def _extract_features(self, reading: dict) -> np.ndarray:
+    def _append_history(self, reading: dict, features_scaled: Optional[np.ndarray] = None):
+        """
+        Append a reading to the history unless it is already the latest entry.
+        
+        Args:
+            reading: Dictionary containing sensor data
+            features_scaled: The reading's scaled features, if already computed
+        """
+        if self.reading_history and self.reading_history[-1] == reading:
+            return
+        
+        self.reading_history.append(reading)
+        
+        # Overwrite the oldest slot of the rolling window
+        self._extract_features(reading, out=self._recent_raw[self._recent_idx])
+        self._recent_idx = (self._recent_idx + 1) % 5
+        self._recent_len = min(self._recent_len + 1, 5)
+        
+        # Append to the scaled history, shifting the last 49 rows to the front when full
+        if self._sc_scale is not None:
+            if features_scaled is None:
+                features_scaled = self._scale(self._extract_features(reading))
+            if self._sh_len == len(self._scaled_history):
+                self._scaled_history[:49] = self._scaled_history[self._sh_len - 49:self._sh_len]
+                self._sh_len = 49
+            self._scaled_history[self._sh_len] = features_scaled
+            self._sh_len += 1
+    
+    def _reset_feature_buffers(self):
+        """Rebuild the rolling raw window and the scaled history from reading_history."""
+        recent = list(islice(self.reading_history, max(0, len(self.reading_history) - 5), None))
+        for row, reading in zip(self._recent_raw, recent):
+            self._extract_features(reading, out=row)
+        self._recent_len = len(recent)
+        self._recent_idx = self._recent_len % 5
+        
+        # Scaling needs a fitted scaler; until then the LSTM has no input anyway
+        if self._sc_scale is None or not self.reading_history:
+            self._sh_len = 0
+            return
+        
+        self._sh_len = len(self.reading_history)
+        self._scaled_history[:self._sh_len] = self._scale(self._stack_features(self.reading_history))
+    
+    def _recent_scaled_sequence(self) -> np.ndarray:
+        """Return the last sequence_length scaled history rows as a view."""
+        return self._scaled_history[self._sh_len - self.sequence_length:self._sh_len]
+    
+    def _cache_scaler_params(self):
+        """Cache the fitted scaler's affine parameters as float32 vectors."""
+        self._sc_scale = self.scaler.scale_.astype(np.float32)
+        self._sc_min = self.scaler.min_.astype(np.float32)
+    
+    def _scale(self, features: np.ndarray) -> np.ndarray:
+        """
+        Apply the fitted MinMaxScaler transform without sklearn's input validation.
+        
+        MinMaxScaler.transform is just x * scale_ + min_, so this broadcasts over a
+        single feature vector or a (n, 5) matrix and returns a new float32 array.
+        
+        Args:
+            features: Raw feature vector or matrix
+            
+        Returns:
+            Scaled features with the same shape
+        """
+        return features * self._sc_scale + self._sc_min
+    
+    def _extract_features(self, reading: dict, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Extract feature vector from sensor reading.
         
+        The values are written into a reusable scratch buffer, so the returned
+        array is only valid until the next call. Pass ``out`` to keep them.
+        
         Args:
             reading: Dictionary containing sensor data
+            out: Optional array of length 5 to write the features into
             
         Returns:
             NumPy array of feature values
         """
         sensors = reading["sensors"]
-        features = np.array([
-            sensors["engine_rpm"],
-            sensors["engine_temp_c"],
-            sensors["vibration_level_g"],
-            sensors["throttle_pos_pct"],
-            sensors["battery_voltage_v"]
-        ])
+        features = self._feat_buf if out is None else out
+        features[0] = sensors["engine_rpm"]
+        features[1] = sensors["engine_temp_c"]
+        features[2] = sensors["vibration_level_g"]
+        features[3] = sensors["throttle_pos_pct"]
+        features[4] = sensors["battery_voltage_v"]
+        
+        return features
+    
+    def _stack_features(self, readings: List[Dict]) -> np.ndarray:
+        """
+        Extract feature vectors for several readings.
+        
+        Args:
+            readings: List of reading dictionaries
+            
+        Returns:
+            float32 array of shape (len(readings), 5)
+        """
+        features = np.empty((len(readings), 5), dtype=np.float32)
+        for row, reading in zip(features, readings):
+            self._extract_features(reading, out=row)
         
         return features
     
@@ -147,15 +412,18 @@ class AnomalyDetector:
             seq_length: Length of input sequences
             
         Returns:
-            X: Input sequences of shape (n_sequences, seq_length, n_features)
+            X: Input sequences of shape (n_sequences, seq_length, n_features),
+               a read-only view into data
             y: Target values of shape (n_sequences, n_features)
         """
-        X, y = [], []
-        for i in range(len(data) - seq_length):
-            X.append(data[i:i + seq_length])
-            y.append(data[i + seq_length])
+        if len(data) <= seq_length:
+            return np.empty((0, seq_length, data.shape[1]), dtype=data.dtype), data[:0]
+
+        # Zero-copy view of every window; the last one has no target, so drop it
+        X = sliding_window_view(data, (seq_length, data.shape[1]))[:-1, 0]
+        y = data[seq_length:]
         
-        return np.array(X), np.array(y)
+        return X, y
     
     def _build_lstm_model(self, input_shape: tuple) -> Sequential:
         """
@@ -184,12 +452,96 @@ class AnomalyDetector:
         
         return model
     
+    def _compile_lstm_inference(self):
+        """
+        Trace the LSTM forward pass into a tf.function for per-tick inference.
+        
+        Keras predict() rebuilds its data pipeline on every call, which costs
+        far more than the forward pass itself for a single sequence.
+        """
+        self._lstm_infer = tf.function(
+            lambda x: self.lstm_model(x, training=False),
+            input_signature=[tf.TensorSpec((None, self.sequence_length, 5), tf.float32)]
+        )
+        # Trace once up front so the first reading does not pay for it
+        self._lstm_infer(tf.zeros((1, self.sequence_length, 5)))
+        
+        # A quantized model takes precedence when requested
+        self._tflite = None
+        if self.quantize_lstm:
+            try:
+                self._build_tflite_interpreter()
+                return
+            except Exception as e:
+                print(f"LSTM quantization failed, using the float model: {e}")
+                self._tflite = None
+        
+        # Prefer ONNX Runtime for single sequences when it is installed
+        self._ort_session = None
+        if ONNX_AVAILABLE and os.getenv("ENABLE_ONNX_LSTM", "true").lower() == "true":
+            try:
+                # from_keras() cannot trace a Keras 3 model, so convert a traced
+                # forward pass for the single sequence this path receives
+                signature = [tf.TensorSpec((1, self.sequence_length, 5), tf.float32, name="sequence")]
+                forward = tf.function(lambda x: self.lstm_model(x, training=False), input_signature=signature)
+                onnx_model, _ = tf2onnx.convert.from_function(forward, input_signature=signature, opset=15)
+                self._ort_session = ort.InferenceSession(
+                    onnx_model.SerializeToString(), providers=["CPUExecutionProvider"]
+                )
+                self._ort_input = self._ort_session.get_inputs()[0].name
+            except Exception as e:
+                print(f"ONNX conversion failed, using TensorFlow for LSTM inference: {e}")
+                self._ort_session = None
+    
+    def _build_tflite_interpreter(self):
+        """
+        Convert the LSTM to TFLite with dynamic-range int8 weights.
+        
+        Only the per-reading path uses it; training keeps the float Keras model.
+        
+        The converter starts from a concrete function with a fixed single
+        sequence input: from_keras_model() leaves the LSTM's TensorList ops
+        without a static element shape, which TFLite cannot convert.
+        """
+        forward = tf.function(
+            lambda x: self.lstm_model(x, training=False),
+            input_signature=[tf.TensorSpec((1, self.sequence_length, 5), tf.float32)]
+        )
+        # No trackable object is passed, so the weights are frozen into the graph;
+        # with one, they stay resource variables the interpreter cannot read
+        converter = tf.lite.TFLiteConverter.from_concrete_functions([forward.get_concrete_function()])
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        interpreter = tf.lite.Interpreter(model_content=converter.convert())
+        interpreter.allocate_tensors()
+        
+        self._tflite_input = interpreter.get_input_details()[0]["index"]
+        self._tflite_output = interpreter.get_output_details()[0]["index"]
+        self._tflite = interpreter
+    
+    def _predict_next(self, sequence: np.ndarray) -> np.ndarray:
+        """
+        Predict the next scaled reading from a single sequence.
+        
+        Args:
+            sequence: Scaled readings of shape (sequence_length, 5)
+            
+        Returns:
+            Predicted scaled feature values
+        """
+        batch = np.asarray(sequence, dtype=np.float32).reshape(1, self.sequence_length, 5)
+        if self._tflite is not None:
+            self._tflite.set_tensor(self._tflite_input, batch)
+            self._tflite.invoke()
+            return self._tflite.get_tensor(self._tflite_output)[0]
+        if self._ort_session is not None:
+            return self._ort_session.run(None, {self._ort_input: batch})[0][0]
+        return self._lstm_infer(batch)[0].numpy()
+    
     def _extract_classification_features(self, reading: dict, 
                                         lstm_prediction: np.ndarray,
                                         lstm_error: np.ndarray) -> np.ndarray:
         """
-        Extract features for XGBoost classification.
-        Includes raw sensor values, LSTM prediction errors, and statistical features.
+        Extract features for XGBoost classification from a sensor reading.
         
         Args:
             reading: Current sensor reading
@@ -199,68 +551,71 @@ class AnomalyDetector:
         Returns:
             Feature vector for classification
         """
-        sensors = reading["sensors"]
-        raw_features = np.array([
-            sensors["engine_rpm"],
-            sensors["engine_temp_c"],
-            sensors["vibration_level_g"],
-            sensors["throttle_pos_pct"],
-            sensors["battery_voltage_v"]
-        ])
+        # Row order in the rolling window does not matter for the statistics
+        return self._classification_features(
+            self._extract_features(reading),
+            lstm_prediction,
+            lstm_error,
+            self._recent_raw[:self._recent_len]
+        )
+    
+    def _classification_features(self, raw_features: np.ndarray,
+                                 lstm_prediction: np.ndarray,
+                                 lstm_error: np.ndarray,
+                                 recent_features: np.ndarray,
+                                 out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Build the XGBoost feature vector from raw sensor values.
+        Includes raw sensor values, LSTM prediction errors, and statistical features.
+        
+        Like _extract_features, the result is written into a reusable buffer
+        unless ``out`` is given.
+        
+        Args:
+            raw_features: Raw sensor values of the current reading
+            lstm_prediction: LSTM predicted values
+            lstm_error: Prediction errors (actual - predicted)
+            recent_features: Raw sensor values of the preceding readings,
+                shape (n, 5)
+            out: Optional array of length N_CLASSIFICATION_FEATURES to write into
+            
+        Returns:
+            Feature vector for classification
+        """
+        features = self._xgb_feat if out is None else out
+        
+        # Raw features, LSTM predictions and errors
+        features[0:5] = raw_features
+        features[5:10] = lstm_prediction
+        features[10:15] = lstm_error
+        np.abs(lstm_error, out=features[15:20])  # Absolute errors
+        np.square(lstm_error, out=features[20:25])  # Squared errors
         
         # Threshold-based anomaly indicators (critical for detecting faults)
-        threshold_features = np.array([
-            1.0 if sensors["engine_temp_c"] > 105 else 0.0,  # Warning threshold
-            1.0 if sensors["engine_temp_c"] > 120 else 0.0,  # Critical threshold
-            1.0 if sensors["vibration_level_g"] > 0.4 else 0.0,  # Warning threshold
-            1.0 if sensors["vibration_level_g"] > 1.0 else 0.0,  # Critical threshold
-            1.0 if sensors["battery_voltage_v"] < 13.5 else 0.0,  # Low voltage
-            1.0 if sensors["battery_voltage_v"] > 14.5 else 0.0,  # High voltage
-            1.0 if sensors["engine_rpm"] > 3000 else 0.0,  # High RPM
-            1.0 if sensors["engine_rpm"] < 800 else 0.0,  # Low RPM
-            sensors["engine_temp_c"] - 105 if sensors["engine_temp_c"] > 105 else 0.0,  # Excess temp
-            sensors["vibration_level_g"] - 0.4 if sensors["vibration_level_g"] > 0.4 else 0.0,  # Excess vibration
-        ])
+        indicators = features[25:33]
+        np.multiply(raw_features[_INDICATOR_IDX], _INDICATOR_SIGN, out=indicators)
+        np.greater(indicators, _INDICATOR_LIMIT, out=indicators)
         
-        # Combine raw features, LSTM predictions, errors, and threshold features
-        features = np.concatenate([
-            raw_features,
-            lstm_prediction,
-            lstm_error,
-            np.abs(lstm_error),  # Absolute errors
-            np.square(lstm_error),  # Squared errors
-            threshold_features  # Threshold violation indicators
-        ])
+        # Excess temperature and vibration over their warning thresholds
+        excess = features[33:35]
+        np.subtract(raw_features[_EXCESS_IDX], _EXCESS_LIMIT, out=excess)
+        np.maximum(excess, 0.0, out=excess)
         
         # Add statistical features from recent history
-        if len(self.reading_history) >= 5:
-            recent_features = np.array([
-                self._extract_features(r) for r in self.reading_history[-5:]
-            ])
+        if len(recent_features) >= 5:
+            recent_features = recent_features[-5:]
             
             # Statistical features
-            mean_features = np.mean(recent_features, axis=0)
-            std_features = np.std(recent_features, axis=0)
-            max_features = np.max(recent_features, axis=0)
-            min_features = np.min(recent_features, axis=0)
+            np.mean(recent_features, axis=0, out=features[35:40])
+            np.std(recent_features, axis=0, out=features[40:45])
+            np.max(recent_features, axis=0, out=features[45:50])
+            np.min(recent_features, axis=0, out=features[50:55])
             
             # Relative changes
-            relative_changes = raw_features - mean_features
-            
-            features = np.concatenate([
-                features,
-                mean_features,
-                std_features,
-                max_features,
-                min_features,
-                relative_changes
-            ])
+            np.subtract(features[0:5], features[35:40], out=features[55:60])
         else:
             # Pad with zeros if not enough history
-            features = np.concatenate([
-                features,
-                np.zeros(25)  # 5 features * 5 stats
-            ])
+            features[35:60] = 0.0
         
         return features
     
@@ -276,20 +631,14 @@ class AnomalyDetector:
         # Ensure no faults are active during training
         simulator.inject_fault(None)
         
-        # Generate normal readings (no faults)
+        # Generate normal readings (no faults) as one raw feature matrix
         print(f"Generating {n_samples} normal readings for training...")
-        training_readings = []
-        for _ in range(n_samples):
-            reading = simulator.generate_reading()
-            training_readings.append(reading)
+        training_data = simulator.generate_readings_batch(n_samples)
         
-        # Extract features
-        training_data = np.array([
-            self._extract_features(r) for r in training_readings
-        ])
-        
-        # Normalize features
+        # Normalize features (the float32 batch keeps the scaler and LSTM in float32)
         training_data_scaled = self.scaler.fit_transform(training_data)
+        self._cache_scaler_params()
+        self._reset_feature_buffers()
         
         # Train LSTM model
         print("Training LSTM model...")
@@ -304,93 +653,85 @@ class AnomalyDetector:
                 verbose=0,
                 validation_split=0.2
             )
+            self._compile_lstm_inference()
             print("LSTM model trained.")
         else:
             raise ValueError("Not enough data to create sequences. Need at least sequence_length + 1 samples.")
         
         # Generate features for XGBoost training
         print("Generating features for XGBoost training...")
-        X_train_xgb = []
-        y_train_xgb = []
-        
-        # Use readings after sequence_length to have LSTM predictions
-        for i in range(self.sequence_length, len(training_readings)):
-            # Get sequence for LSTM prediction
-            sequence = training_data_scaled[i - self.sequence_length:i]
-            sequence = sequence.reshape(1, self.sequence_length, 5)
-            
-            # Get LSTM prediction
-            lstm_pred = self.lstm_model.predict(sequence, verbose=0)[0]
-            
-            # Get actual values
-            actual = training_data_scaled[i]
-            
-            # Calculate errors
-            lstm_error = actual - lstm_pred
-            
-            # Extract classification features
-            # Need to temporarily store history
-            temp_history = self.reading_history.copy()
-            self.reading_history = training_readings[max(0, i-5):i]
-            
-            features = self._extract_classification_features(
-                training_readings[i],
-                lstm_pred,
-                lstm_error
+        anomaly_types = ["overheat", "vibration", "battery_failure", 
+                        "throttle_malfunction", "engine_misfire", 
+                        "fuel_system", "cooling_system"]
+        n_anomalies_per_type = max(50, int(n_samples * 0.1))  # At least 50 samples per type, or 10% of n_samples
+        
+        # Feature rows are written in place; normal rows first, then anomalies
+        n_normal = len(training_data) - self.sequence_length
+        n_total = n_normal + len(anomaly_types) * n_anomalies_per_type
+        X_train_xgb = np.empty((n_total, N_CLASSIFICATION_FEATURES), dtype=np.float32)
+        y_train_xgb = np.zeros(n_total, dtype=int)  # 0 = normal
+        y_train_xgb[n_normal:] = 1  # 1 = anomaly
+        
+        # Use readings after sequence_length to have LSTM predictions.
+        # X_seq[j] is the sequence preceding reading j + sequence_length and
+        # y_seq[j] its actual values, so a single batched pass covers them all.
+        lstm_preds = self.lstm_model.predict(X_seq, batch_size=512, verbose=0)
+        lstm_errors = y_seq - lstm_preds
+        
+        for row, i in enumerate(range(self.sequence_length, len(training_data))):
+            # Extract classification features, using the preceding readings as history
+            self._classification_features(
+                training_data[i],
+                lstm_preds[row],
+                lstm_errors[row],
+                training_data[max(0, i-5):i],
+                out=X_train_xgb[row]
             )
-            
-            X_train_xgb.append(features)
-            y_train_xgb.append(0)  # 0 = normal
-            
-            # Restore history
-            self.reading_history = temp_history
         
         # Generate anomaly samples for training XGBoost
         # Use a fixed number per fault type to ensure good coverage
         print("Generating anomaly samples for XGBoost training...")
-        anomaly_types = ["overheat", "vibration", "battery_failure", 
-                        "throttle_malfunction", "engine_misfire", 
-                        "fuel_system", "cooling_system"]
-        n_anomalies_per_type = max(50, int(n_samples * 0.1))  # At least 50 samples per type, or 10% of n_samples
+        # Every anomaly sample is scored against the last normal sequence
+        # (training above guarantees there is one), so predict it only once
+        last_sequence = training_data_scaled[-self.sequence_length:]
+        lstm_pred = self._predict_next(last_sequence)
+        recent_normal = training_data[-5:]
         
+        row = n_normal
         for fault_type in anomaly_types:
             simulator.inject_fault(fault_type)
-            for _ in range(n_anomalies_per_type):
-                reading = simulator.generate_reading()
-                features_raw = self._extract_features(reading)
-                features_scaled = self.scaler.transform(features_raw.reshape(1, -1))[0]
-                
-                # Use recent normal history for sequence if available
-                if len(training_data_scaled) >= self.sequence_length:
-                    # Use last normal sequence
-                    sequence = training_data_scaled[-self.sequence_length:].reshape(1, self.sequence_length, 5)
-                    lstm_pred = self.lstm_model.predict(sequence, verbose=0)[0]
-                    lstm_error = features_scaled - lstm_pred
-                    
-                    # Use recent normal readings for history
-                    self.reading_history = training_readings[-5:]
-                    features = self._extract_classification_features(reading, lstm_pred, lstm_error)
-                    X_train_xgb.append(features)
-                    y_train_xgb.append(1)  # 1 = anomaly
+            fault_data = simulator.generate_readings_batch(n_anomalies_per_type)
+            fault_errors = self._scale(fault_data) - lstm_pred
+            
+            for features_raw, lstm_error in zip(fault_data, fault_errors):
+                # Use recent normal readings for history
+                self._classification_features(
+                    features_raw, lstm_pred, lstm_error, recent_normal,
+                    out=X_train_xgb[row]
+                )
+                row += 1
         
         # Reset to normal
         simulator.inject_fault(None)
         
-        # Train XGBoost model
-        print("Training XGBoost model...")
-        X_train_xgb = np.array(X_train_xgb)
-        y_train_xgb = np.array(y_train_xgb)
-        
+        # Train XGBoost model, on the GPU if one is visible and XGBoost was built for it
+        device = "cuda" if XGB_CUDA_AVAILABLE and tf.config.list_physical_devices('GPU') else "cpu"
+        print(f"Training XGBoost model on {device}...")
         self.xgb_model = XGBClassifier(
-            n_estimators=200,
-            max_depth=8,
-            learning_rate=0.05,
+            n_estimators=self.n_estimators,
+            max_depth=self.max_depth,
+            learning_rate=self.learning_rate,
             random_state=42,
             eval_metric='logloss',
+            device=device,
             scale_pos_weight=len(y_train_xgb[y_train_xgb == 0]) / len(y_train_xgb[y_train_xgb == 1]) if len(y_train_xgb[y_train_xgb == 1]) > 0 else 1.0
         )
         
         self.xgb_model.fit(X_train_xgb, y_train_xgb)
+        
+        # Per-reading rows live in host memory, so score on the CPU
+        self.xgb_model.set_params(device="cpu")
+        self._booster = self.xgb_model.get_booster()
         print("XGBoost model trained.")
         
         self.is_trained = True
@@ -399,6 +740,21 @@ class AnomalyDetector:
         # Save models to disk for persistence
         self._save_models()
     
+    def _anomaly_probabilities(self, features: np.ndarray) -> np.ndarray:
+        """
+        Score classification feature rows with the XGBoost booster directly.
+        
+        inplace_predict reads the NumPy array as is, skipping the sklearn
+        wrapper's validation and the DMatrix built by predict/predict_proba.
+        
+        Args:
+            features: Feature matrix of shape (n, N_CLASSIFICATION_FEATURES)
+            
+        Returns:
+            Probability of the anomaly class for each row
+        """
+        return self._booster.inplace_predict(features)
+    
     def _check_critical_thresholds(self, reading: dict) -> bool:
         """
         Check if any sensor readings exceed critical thresholds.
@@ -438,42 +794,27 @@ class AnomalyDetector:
         
         return False
     
-    def detect_anomaly(self, reading: dict) -> int:
+    def _score_reading(self, reading: dict) -> float:
         """
-        Detect if a reading is anomalous using LSTM + XGBoost with rule-based fallback.
+        Run the LSTM + XGBoost pipeline on a reading and add it to the history.
+        
+        The reading is scored against the history as it is on entry, and is
+        only appended if it is not already the latest entry.
         
         Args:
             reading: Dictionary containing sensor data
             
         Returns:
-            -1 if anomaly detected, 1 if normal
+            Probability that the reading is an anomaly
         """
-        if not self.is_trained:
-            raise ValueError("Model must be trained before detection. Call train_initial_model() first.")
-        
-        # FIRST: Check rule-based thresholds (always catches critical anomalies)
-        if self._check_critical_thresholds(reading):
-            # Update history
-            if not self.reading_history or self.reading_history[-1] != reading:
-                self.reading_history.append(reading)
-                if len(self.reading_history) > 50:
-                    self.reading_history = self.reading_history[-50:]
-            return -1  # Anomaly detected by rules
-        
         # Extract features
         features_raw = self._extract_features(reading)
-        features_scaled = self.scaler.transform(features_raw.reshape(1, -1))[0]
+        features_scaled = self._scale(features_raw)
         
         # Get LSTM prediction
-        if len(self.reading_history) >= self.sequence_length:
-            # Use recent history for sequence
-            recent_features = np.array([
-                self._extract_features(r) for r in self.reading_history[-self.sequence_length:]
-            ])
-            recent_features_scaled = self.scaler.transform(recent_features)
-            sequence = recent_features_scaled.reshape(1, self.sequence_length, 5)
-            
-            lstm_pred = self.lstm_model.predict(sequence, verbose=0)[0]
+        if self._sh_len >= self.sequence_length:
+            # Use the last sequence_length rows of the scaled history
+            lstm_pred = self._predict_next(self._recent_scaled_sequence())
         else:
             # Not enough history, use current reading as prediction (fallback)
             lstm_pred = features_scaled
@@ -485,64 +826,89 @@ class AnomalyDetector:
         features = self._extract_classification_features(reading, lstm_pred, lstm_error)
         features = features.reshape(1, -1)
         
-        # XGBoost prediction
-        prediction = self.xgb_model.predict(features)[0]
+        # XGBoost probability prediction
+        anomaly_prob = float(self._anomaly_probabilities(features)[0])
         
         # Update history (will be synced back to session state)
         # Only add if not already the last reading (avoid duplicates)
-        if not self.reading_history or self.reading_history[-1] != reading:
-            self.reading_history.append(reading)
-            # Keep only recent history (last 50 readings)
-            if len(self.reading_history) > 50:
-                self.reading_history = self.reading_history[-50:]
-        
-        # Return -1 for anomaly (class 1), 1 for normal (class 0)
-        return -1 if prediction == 1 else 1
+        self._append_history(reading, features_scaled)
+        
+        return anomaly_prob
     
-    def get_anomaly_score(self, reading: dict) -> float:
+    def detect_anomaly(self, reading: dict) -> int:
         """
-        Get the anomaly score for a reading (higher = more anomalous).
+        Detect if a reading is anomalous using LSTM + XGBoost with rule-based fallback.
+        
+        The models see the history from before the reading, which is then
+        added to it.
         
         Args:
             reading: Dictionary containing sensor data
             
         Returns:
-            Anomaly score (probability of being an anomaly)
+            -1 if anomaly detected, 1 if normal
         """
         if not self.is_trained:
-            raise ValueError("Model must be trained before scoring. Call train_initial_model() first.")
+            raise ValueError("Model must be trained before detection. Call train_initial_model() first.")
         
-        # Extract features
-        features_raw = self._extract_features(reading)
-        features_scaled = self.scaler.transform(features_raw.reshape(1, -1))[0]
+        # FIRST: Check rule-based thresholds (always catches critical anomalies)
+        if self._check_critical_thresholds(reading):
+            # Update history
+            self._append_history(reading)
+            return -1  # Anomaly detected by rules
         
-        # Get LSTM prediction
-        if len(self.reading_history) >= self.sequence_length:
-            recent_features = np.array([
-                self._extract_features(r) for r in self.reading_history[-self.sequence_length:]
-            ])
-            recent_features_scaled = self.scaler.transform(recent_features)
-            sequence = recent_features_scaled.reshape(1, self.sequence_length, 5)
+        # XGBoost prediction: class 1 (anomaly) when its probability exceeds 0.5
+        return -1 if self._score_reading(reading) > 0.5 else 1
+    
+    def detect_and_score(self, reading: dict, with_score: bool = True) -> Tuple[int, Optional[float]]:
+        """
+        Detect whether a reading is anomalous and score it in one call.
+        
+        Replaces detect_anomaly() followed by get_anomaly_score(), running the
+        models at most once. Like detect_anomaly(), a reading that trips a
+        critical threshold needs no model pass, so it is skipped unless the
+        score is requested. The score is computed against the history from
+        before the reading arrived.
+        
+        Args:
+            reading: Dictionary containing sensor data
+            with_score: Whether to return the anomaly score
             
-            lstm_pred = self.lstm_model.predict(sequence, verbose=0)[0]
-        else:
-            lstm_pred = features_scaled
+        Returns:
+            Tuple of (-1 if anomaly detected else 1, anomaly score or None
+            when with_score is False)
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before detection. Call train_initial_model() first.")
         
-        # Calculate prediction error
-        lstm_error = features_scaled - lstm_pred
+        rule_hit = self._check_critical_thresholds(reading)
+        if rule_hit and not with_score:
+            self._append_history(reading)
+            return -1, None
         
-        # Extract classification features
-        features = self._extract_classification_features(reading, lstm_pred, lstm_error)
-        features = features.reshape(1, -1)
+        anomaly_prob = self._score_reading(reading)
+        is_anomaly = rule_hit or anomaly_prob > 0.5
         
-        # XGBoost probability prediction
-        anomaly_prob = self.xgb_model.predict_proba(features)[0][1]
+        return (-1 if is_anomaly else 1), (-anomaly_prob if with_score else None)
+    
+    def get_anomaly_score(self, reading: dict) -> float:
+        """
+        Get the anomaly score for a reading (higher = more anomalous).
+        
+        The reading is scored against the current history, so after
+        detect_anomaly() on the same reading that history already ends with
+        it. Use detect_and_score() to get both from one model pass.
+        
+        Args:
+            reading: Dictionary containing sensor data
+            
+        Returns:
+            Anomaly score (probability of being an anomaly)
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before scoring. Call train_initial_model() first.")
         
-        # Update history only if not already added (detect_anomaly may have added it)
-        if not self.reading_history or self.reading_history[-1] != reading:
-            self.reading_history.append(reading)
-            if len(self.reading_history) > 50:
-                self.reading_history = self.reading_history[-50:]
+        anomaly_prob = self._score_reading(reading)
         
         # Return probability as score (convert to negative for consistency with old interface)
         # Higher probability = more anomalous, so we return negative of probability
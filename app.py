@@ -5,6 +5,13 @@ Streamlit application for real-time vehicle monitoring and anomaly detection.
 
 import streamlit as st
 import time
+import copy
+from collections import deque
+from functools import lru_cache
+from html import escape as html_escape
+from types import MappingProxyType
+from typing import Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import plotly.graph_objects as go
@@ -51,28 +58,39 @@ def load_streamlit_secrets():
         pass
     return False
 
-# Priority: Streamlit secrets > python-dotenv > manual .env loading
-if not load_streamlit_secrets():
-    try:
-        from dotenv import load_dotenv
-        load_dotenv()
-    except ImportError:
-        load_env_file()
+@st.cache_resource
+def _load_env_once():
+    """
+    Populate os.environ once per server process.
+    
+    Streamlit re-executes this script on every interaction, and os.environ is
+    process-wide, so the secrets lookup and .env parse only need to run once.
+    """
+    # Priority: Streamlit secrets > python-dotenv > manual .env loading
+    if not load_streamlit_secrets():
+        try:
+            from dotenv import load_dotenv
+            load_dotenv()
+        except ImportError:
+            load_env_file()
+    return True
 
-from vehicle_sim import VehicleSimulator
+_ = _load_env_once()
+
+from vehicle_sim import SENSOR_NAMES, VehicleSimulator
 from anomaly_model import AnomalyDetector
 from maintenance_agent import (
     analyze_anomaly, 
     get_issue_details, 
     get_severity_level,
-    calculate_health_score,
-    get_predicted_issue,
-    get_risk_level
+    get_health_summary
 )
 
 # Voice booking imports
 import asyncio
 import os
+import queue
+import threading
 from voice_booking_agent import (
     BookingRequest,
     BookingResult,
@@ -96,753 +114,829 @@ st.set_page_config(
 # ============================================
 # GLOBAL PREMIUM UI STYLING
 # ============================================
-st.markdown("""
-<style>
-    /* Import Premium Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700;800&family=IBM+Plex+Mono:wght@400;500;600&display=swap');
-    
-    /* Root Variables - Premium Dark Theme */
-    :root {
-        --bg-primary: #0a0a0b;
-        --bg-secondary: #111113;
-        --bg-tertiary: #18181b;
-        --bg-card: #1c1c1f;
-        --bg-card-hover: #222225;
-        --border-subtle: #27272a;
-        --border-medium: #3f3f46;
-        --text-primary: #fafafa;
-        --text-secondary: #a1a1aa;
-        --text-muted: #71717a;
-        --accent-primary: #10b981;
-        --accent-secondary: #06b6d4;
-        --accent-warning: #f59e0b;
-        --accent-danger: #ef4444;
-        --accent-gradient: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-        --shadow-sm: 0 1px 2px rgba(0, 0, 0, 0.4);
-        --shadow-md: 0 4px 12px rgba(0, 0, 0, 0.5);
-        --shadow-lg: 0 8px 24px rgba(0, 0, 0, 0.6);
-        --radius-sm: 6px;
-        --radius-md: 10px;
-        --radius-lg: 16px;
-        --radius-xl: 24px;
-    }
-    
-    /* Global Styles */
-    .stApp {
-        background: var(--bg-primary) !important;
-        font-family: 'Outfit', -apple-system, BlinkMacSystemFont, sans-serif !important;
-    }
-    
-    
-    /* Custom Scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    ::-webkit-scrollbar-track {
-        background: var(--bg-secondary);
-    }
-    ::-webkit-scrollbar-thumb {
-        background: var(--border-medium);
-        border-radius: 4px;
-    }
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--text-muted);
-    }
-    
-    /* Sidebar Styling */
-    [data-testid="stSidebar"] {
-        background: var(--bg-secondary) !important;
-        border-right: 1px solid var(--border-subtle) !important;
-    }
-    
-    [data-testid="stSidebar"] .stMarkdown {
-        color: var(--text-primary) !important;
-    }
-    
-    [data-testid="stSidebar"] h1, 
-    [data-testid="stSidebar"] h2, 
-    [data-testid="stSidebar"] h3 {
-        color: var(--text-primary) !important;
-        font-family: 'Outfit', sans-serif !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Main Content Area */
-    .main .block-container {
-        padding: 2rem 3rem !important;
-        max-width: 1400px !important;
-    }
-    
-    /* Typography */
-    h1, h2, h3, h4, h5, h6 {
-        font-family: 'Outfit', sans-serif !important;
-        color: var(--text-primary) !important;
-        font-weight: 600 !important;
-        letter-spacing: -0.02em !important;
-    }
-    
-    h1 { font-size: 2.5rem !important; font-weight: 700 !important; }
-    h2 { font-size: 1.75rem !important; }
-    h3 { font-size: 1.25rem !important; }
-    
-    p, span, div {
-        font-family: 'Outfit', sans-serif !important;
-    }
-    
-    /* Metric Cards */
-    [data-testid="stMetric"] {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-radius: var(--radius-lg) !important;
-        padding: 1.25rem !important;
-        transition: all 0.2s ease !important;
-    }
-    
-    [data-testid="stMetric"]:hover {
-        background: var(--bg-card-hover) !important;
-        border-color: var(--border-medium) !important;
-        transform: translateY(-2px);
-    }
-    
-    [data-testid="stMetric"] label {
-        color: var(--text-secondary) !important;
-        font-size: 0.875rem !important;
-        font-weight: 500 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 0.05em !important;
-    }
-    
-    [data-testid="stMetric"] [data-testid="stMetricValue"] {
-        color: var(--text-primary) !important;
-        font-family: 'IBM Plex Mono', monospace !important;
-        font-size: 1.75rem !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        font-family: 'Outfit', sans-serif !important;
-        font-weight: 600 !important;
-        font-size: 0.9rem !important;
-        padding: 0.75rem 1.5rem !important;
-        border-radius: var(--radius-md) !important;
-        transition: all 0.2s ease !important;
-        letter-spacing: 0.01em !important;
-    }
-    
-    .stButton > button[kind="primary"] {
-        background: var(--accent-gradient) !important;
-        border: none !important;
-        color: white !important;
-        box-shadow: 0 4px 14px rgba(16, 185, 129, 0.3) !important;
-    }
-    
-    .stButton > button[kind="primary"]:hover {
-        transform: translateY(-2px) !important;
-        box-shadow: 0 6px 20px rgba(16, 185, 129, 0.4) !important;
-    }
-    
-    .stButton > button[kind="secondary"] {
-        background: var(--bg-tertiary) !important;
-        border: 1px solid var(--border-medium) !important;
-        color: var(--text-primary) !important;
-    }
-    
-    .stButton > button[kind="secondary"]:hover {
-        background: var(--bg-card-hover) !important;
-        border-color: var(--text-muted) !important;
-    }
-    
-    /* Select boxes and Inputs */
-    .stSelectbox > div > div,
-    .stTextInput > div > div > input,
-    .stNumberInput > div > div > input {
-        background: var(--bg-tertiary) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-radius: var(--radius-md) !important;
-        color: var(--text-primary) !important;
-        font-family: 'Outfit', sans-serif !important;
-    }
-    
-    .stSelectbox > div > div:hover,
-    .stTextInput > div > div > input:hover {
-        border-color: var(--border-medium) !important;
-    }
-    
-    .stSelectbox > div > div:focus-within,
-    .stTextInput > div > div > input:focus {
-        border-color: var(--accent-primary) !important;
-        box-shadow: 0 0 0 2px rgba(16, 185, 129, 0.2) !important;
-    }
-    
-    /* Labels */
-    .stSelectbox label,
-    .stTextInput label,
-    .stNumberInput label,
-    .stCheckbox label {
-        color: var(--text-secondary) !important;
-        font-size: 0.875rem !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Info/Warning/Error boxes */
-    .stAlert {
-        border-radius: var(--radius-md) !important;
-        border: none !important;
-    }
-    
-    [data-testid="stAlert"][data-baseweb="notification"] {
-        background: var(--bg-card) !important;
-        border-left: 4px solid var(--accent-primary) !important;
-    }
-    
-    /* Expanders */
-    .streamlit-expanderHeader {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-radius: var(--radius-md) !important;
-        color: var(--text-primary) !important;
-        font-family: 'Outfit', sans-serif !important;
-        font-weight: 500 !important;
-    }
-    
-    .streamlit-expanderContent {
-        background: var(--bg-tertiary) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-top: none !important;
-        border-radius: 0 0 var(--radius-md) var(--radius-md) !important;
-    }
-    
-    /* Dataframes */
-    .stDataFrame {
-        border-radius: var(--radius-lg) !important;
-        overflow: hidden !important;
-    }
-    
-    [data-testid="stDataFrame"] > div {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-subtle) !important;
-        border-radius: var(--radius-lg) !important;
-    }
-    
-    /* Plotly Charts - Dark Theme */
-    .js-plotly-plot .plotly .modebar {
-        background: var(--bg-card) !important;
-    }
-    
-    /* Checkbox */
-    .stCheckbox > label > div[data-testid="stCheckbox"] {
-        background: var(--bg-tertiary) !important;
-        border-color: var(--border-medium) !important;
-    }
-    
-    /* Caption text */
-    .stCaption {
-        color: var(--text-muted) !important;
-        font-size: 0.8rem !important;
-    }
-    
-    /* Dividers */
-    hr {
-        border-color: var(--border-subtle) !important;
-    }
-    
-    /* Premium Brand Header */
-    .premium-header {
-        display: flex;
-        align-items: center;
-        gap: 16px;
-        padding: 24px 0;
-        margin-bottom: 32px;
-        border-bottom: 1px solid var(--border-subtle);
-    }
-    
-    .premium-logo {
-        width: 48px;
-        height: 48px;
-        background: var(--accent-gradient);
-        border-radius: 12px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 24px;
-    }
-    
-    .premium-title {
-        font-family: 'Outfit', sans-serif;
-        font-size: 1.5rem;
-        font-weight: 700;
-        color: var(--text-primary);
-        letter-spacing: -0.02em;
-    }
-    
-    .premium-subtitle {
-        font-family: 'Outfit', sans-serif;
-        font-size: 0.875rem;
-        color: var(--text-muted);
-        margin-top: 2px;
-    }
-    
-    .premium-badge {
-        background: var(--accent-gradient);
-        color: white;
-        font-size: 0.7rem;
-        font-weight: 600;
-        padding: 4px 10px;
-        border-radius: 20px;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-    
-    /* Status Indicator */
-    .status-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        display: inline-block;
-        margin-right: 8px;
-        animation: pulse 2s ease-in-out infinite;
-    }
-    
-    .status-dot.active {
-        background: var(--accent-primary);
-        box-shadow: 0 0 8px var(--accent-primary);
-    }
-    
-    .status-dot.warning {
-        background: var(--accent-warning);
-        box-shadow: 0 0 8px var(--accent-warning);
-    }
-    
-    .status-dot.danger {
-        background: var(--accent-danger);
-        box-shadow: 0 0 8px var(--accent-danger);
+# Premium fonts, loaded with <link> tags rather than an @import inside the
+# stylesheet so the font CSS is fetched in parallel, with connections opened
+# early and text painted in a fallback font until the webfonts arrive
+# (only the weights the stylesheets actually use are requested)
+FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link href="https://fonts.googleapis.com/css2?family=Outfit:wght@400;500;600;700&family=IBM+Plex+Mono:wght@400;500;600&family=DM+Sans:wght@400;500;600;700&display=swap" rel="stylesheet">
+"""
+
+# st.html sanitizes <link> tags away, so these go through st.markdown
+st.markdown(FONT_LINKS, unsafe_allow_html=True)
+
+# The theme stylesheet is a static file (served by Streamlit's static file
+# serving, see .streamlit/config.toml), so browsers cache it across reruns and
+# sessions and each rerun only sends a <link> tag
+THEME_CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "premium_theme.css")
+
+
+@st.cache_resource
+def _theme_link() -> str:
+    """
+    Build the <link> tag for the theme stylesheet.
+    
+    The file's modification time is added as a query string, so browsers fetch
+    the sheet again once a server restart picks up a changed file.
+    """
+    version = int(os.path.getmtime(THEME_CSS_PATH))
+    return f'<link rel="stylesheet" href="./app/static/premium_theme.css?v={version}">'
+
+
+# st.html sanitizes <link> tags away, so this goes through st.markdown
+st.markdown(_theme_link(), unsafe_allow_html=True)
+
+# Readings kept in the session history (and so on the telemetry chart)
+HISTORY_LENGTH = 100
+
+# Telemetry chart column -> dtype; each session keeps these as columnar buffers
+# filled one reading at a time, so the chart data is not rebuilt from dicts
+HISTORY_COLUMNS = MappingProxyType({
+    "timestamp": "datetime64[s]",
+    **{name: np.float32 for name in SENSOR_NAMES},
+    "throttle_pos_pct": np.int16,  # whole percent in every reading
+    "anomaly": np.int8,
+    "anomaly_score": np.float32
+})
+
+
+def _new_history_buffers() -> dict:
+    """
+    Create empty chart history buffers.
+    
+    Each column has room for twice HISTORY_LENGTH rows, so the newest rows
+    only need shifting to the front once every HISTORY_LENGTH appends.
+    
+    Returns:
+        Dictionary with the column arrays and the end index of the filled rows
+    """
+    return {
+        "columns": {name: np.empty(2 * HISTORY_LENGTH, dtype=dtype) for name, dtype in HISTORY_COLUMNS.items()},
+        "end": 0
     }
+
+
+# Initialize session state
+SESSION_DEFAULTS = {
+    "readings_history": deque(maxlen=HISTORY_LENGTH),  # oldest readings drop off as new ones arrive
+    "history_buffers": _new_history_buffers(),  # columnar copy of the chart window
+    "chart_stale": True,  # a reading was recorded since the chart data was last set
+    "anomalies_detected": [],
+    "auto_update": True,  # Start with auto-update enabled
+    "update_interval": 5,  # Default to 5 seconds
+    "current_page": "dashboard",  # dashboard, issue_details, schedule_service, confirmation
+    "current_issue": None,
+    "appointments": [],
+    "latest_appointment": None,
+    "appointments_page": 1,  # pages of APPOINTMENTS_PAGE_SIZE shown on the appointments page
+    "show_notification": False,
+    "auto_booking_status": None,
+    "auto_booking_result": None,
+    "auto_booking_logs": [],
+    "booking_in_progress": False,
+    "booking_job": None,  # background AI booking call, see _start_booking_job()
+    "auto_booking_triggered": False,
+    "auto_booking_complete": False,
+    "center_final_status": {},  # center name -> latest AutoBookingProgress
+    "confirmed_bookings": {},  # auto-booking request -> confirmed booking, see BOOKING_REUSE_TTL
+    # Default customer info (would come from user profile in production)
+    "customer_info": {
+        "name": "John Doe",
+        "phone": "+1 (555) 123-4567",
+        "email": "john.doe@example.com"
+    },
+    # time.monotonic() of the last auto-update; set on first use
+    "last_update_time": 0.0,
+}
+
+@st.cache_resource(show_spinner="Training anomaly detection model on normal vehicle data... (This only happens once)")
+def get_trained_detector() -> AnomalyDetector:
+    """
+    Load the saved models, or train them, once per server process.
+    
+    Each session works on a fork() of this detector, which shares the models
+    but keeps its own reading history.
+    """
+    return AnomalyDetector.load_or_train(n_samples=1000)
+
+
+# The simulator stays per session: it carries each user's vehicle ID, injected
+# fault and driving state, and building one only sets a few floats
+if "simulator" not in st.session_state:
+    st.session_state.simulator = VehicleSimulator()
+if getattr(st.session_state.get("detector"), "VERSION", 1) < AnomalyDetector.VERSION:
+    # New session, or a detector from an older version of the class
+    st.session_state.detector = get_trained_detector().fork()
+
+# Set any missing session values (copied, so sessions never share the lists)
+for _key, _value in SESSION_DEFAULTS.items():
+    if _key not in st.session_state:
+        st.session_state[_key] = copy.deepcopy(_value)
+
+
+# Sidebar fault simulation label -> VehicleSimulator fault type (None clears it)
+FAULT_TYPES = MappingProxyType({
+    "None": None,
+    "Overheat": "overheat",
+    "Vibration": "vibration",
+    "Battery Failure": "battery_failure",
+    "Throttle Malfunction": "throttle_malfunction",
+    "Engine Misfire": "engine_misfire",
+    "Fuel System Issue": "fuel_system",
+    "Cooling System Failure": "cooling_system"
+})
+FAULT_LABELS = tuple(FAULT_TYPES)
+
+# Sidebar auto-update interval label -> seconds
+INTERVAL_OPTIONS = MappingProxyType({
+    "1 second": 1,
+    "2 seconds": 2,
+    "5 seconds": 5,
+    "10 seconds": 10,
+    "30 seconds": 30,
+    "1 minute": 60,
+    "2 minutes": 120,
+    "5 minutes": 300
+})
+INTERVAL_LABELS = tuple(INTERVAL_OPTIONS)
+# Seconds -> position of that interval in INTERVAL_LABELS
+INTERVAL_INDEX = MappingProxyType({
+    seconds: idx for idx, seconds in enumerate(INTERVAL_OPTIONS.values())
+})
+
+# The auto-update fragment's browser timer can fire a little before the
+# interval has passed on the server; a tick this close counts as due
+AUTO_UPDATE_SLACK = 0.25
+
+# Seconds between refreshes of the update countdown and the sidebar counters
+# while auto-update is on, independent of the (possibly much longer) interval
+STATUS_REFRESH_INTERVAL = 1
+
+# Service centers in booking order
+SERVICE_CENTERS = tuple(SERVICE_CENTER_DIRECTORY)
+
+# Service type to book for each detected issue
+SERVICE_TYPES = MappingProxyType({
+    "Battery Health Deterioration": "Battery Diagnosis & Replacement",
+    "Battery Failure Critical": "Battery Diagnosis & Replacement",
+    "Coolant System Failure": "Cooling System Inspection & Repair",
+    "Cooling System Failure": "Cooling System Inspection & Repair",
+    "Mechanical Looseness Detected": "Vibration Diagnosis & Repair",
+    "Engine Misfire Detected": "Engine Inspection & Repair",
+    "Throttle System Malfunction": "Throttle System Repair",
+    "Fuel System Malfunction": "Fuel System Inspection & Repair"
+})
+DEFAULT_SERVICE_TYPE = "General Inspection & Diagnosis"
+SERVICE_OPTIONS = (*sorted(set(SERVICE_TYPES.values())), DEFAULT_SERVICE_TYPE)
+
+# Issue title -> index of its service type in SERVICE_OPTIONS
+SERVICE_OPTION_INDEX = MappingProxyType({
+    issue: SERVICE_OPTIONS.index(service) for issue, service in SERVICE_TYPES.items()
+})
+
+# Appointments listed per page on the appointments page
+APPOINTMENTS_PAGE_SIZE = 10
+
+# Most call-log entries shown on the Schedule Service page
+CALL_LOG_MAX_ENTRIES = 50
+
+# Seconds a confirmed auto-booking is reused for an identical request instead
+# of calling the service centers again
+BOOKING_REUSE_TTL = 300
+
+
+# Severity styling for the Issue Detected page (dark theme)
+SEVERITY_STYLES = MappingProxyType({
+    "Critical": {"class": "severity-critical", "icon": "●", "glow": "#ef4444"},
+    "High": {"class": "severity-high", "icon": "●", "glow": "#f59e0b"},
+    "Medium": {"class": "severity-medium", "icon": "●", "glow": "#06b6d4"},
+    "Low": {"class": "severity-low", "icon": "●", "glow": "#10b981"}
+})
+NO_ISSUE_SEVERITY_STYLE = MappingProxyType({"class": "severity-medium", "icon": "○", "glow": "#71717a"})
+
+
+def _severity_badge(style, severity: str) -> str:
+    """Render the severity badge shown on the Issue Detected page."""
+    return f'<span class="{style["class"]}">{style["icon"]} {html_escape(severity)}</span>'
+
+
+# Badges for the styled severities, rendered once at import
+SEVERITY_BADGE_HTML = MappingProxyType({
+    severity: _severity_badge(style, severity) for severity, style in SEVERITY_STYLES.items()
+})
+
+
+# Static markup for the Issue Detected page; the card templates are filled with
+# str.format, so anything user-facing must be escaped before it is passed in
+ISSUE_HEADER_HTML = """
+<div class="issue-header">
+    <div class="issue-logo-icon" style="font-size: 18px; font-weight: 700; color: white;">VC</div>
+    <div class="issue-header-text">
+        <div class="issue-header-title">VehicleCare AI</div>
+        <div class="issue-header-subtitle">Predictive Maintenance Alert</div>
+    </div>
+</div>
+"""
+
+ISSUE_ALERT_HTML = """
+<div class="alert-banner">
+    <span class="alert-banner-icon" style="color: #fca5a5; font-weight: bold;">!</span>
+    <span class="alert-banner-text">Anomaly detected - Automated service booking initiated</span>
+</div>
+"""
+
+ISSUE_CARD_TPL = """
+<div class="issue-card">
+    <div class="issue-card-header">
+        <div class="issue-card-icon danger" style="font-weight: bold; color: #f87171;">!</div>
+        <div>
+            <div class="issue-card-label">Issue Identified</div>
+            <div class="issue-card-title">{title}</div>
+        </div>
+    </div>
+    <div class="issue-card-content">{description}</div>
+</div>
+"""
+
+SEVERITY_CARD_TPL = """
+<div class="issue-card">
+    <div class="issue-card-header">
+        <div class="issue-card-icon info" style="font-weight: bold; color: #22d3ee;">i</div>
+        <div>
+            <div class="issue-card-label">Diagnostic Analysis</div>
+            <div class="issue-card-title">Severity Assessment</div>
+        </div>
+    </div>
+    <div class="severity-row">
+        <span class="severity-label">Risk Level</span>
+        {badge}
+    </div>
+</div>
+"""
+
+ISSUE_ACTION_HTML = """
+<div class="issue-card">
+    <div class="issue-card-header">
+        <div class="issue-card-icon action" style="font-weight: bold; color: #34d399;">AI</div>
+        <div>
+            <div class="issue-card-label">Automated Response</div>
+            <div class="issue-card-title">AI Service Booking</div>
+        </div>
+    </div>
+    <div class="action-box">
+        <p>VehicleCare AI is automatically contacting service centers to schedule your appointment. No action required.</p>
+    </div>
+</div>
+
+<div class="booking-status">
+    <div class="booking-status-icon" style="font-size: 24px; color: #34d399;">●</div>
+    <div class="booking-status-text">Initiating automated booking...</div>
+    <div class="booking-status-subtext">Calling service centers to find the best available slot</div>
+</div>
+"""
+
+
+# Appointment Confirmation page details card; values must be escaped before
+# they are passed in
+APPOINTMENT_DETAILS_TPL = """
+<div class="data-card details-card">
+    <div class="details-card-header">
+        <div class="details-card-icon" style="font-weight: 600; color: #22d3ee;">≡</div>
+        <div class="data-card-title">Appointment Details {badge}</div>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Confirmation #</span>
+        <span class="data-value details-value">{confirmation_number}</span>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Service Center</span>
+        <span class="data-value details-value">{service_center}</span>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Service Type</span>
+        <span class="data-value details-value">{service_type}</span>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Date</span>
+        <span class="data-value details-value">{date}</span>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Time</span>
+        <span class="data-value details-value">{time}</span>
+    </div>
+    <div class="data-row details-row">
+        <span class="data-label details-label">Booking Method</span>
+        <span class="data-value details-value">{booking_method}</span>
+    </div>
+</div>
+"""
+
+AI_BOOKED_BADGE_HTML = (
+    '<span style="background: linear-gradient(135deg, #8b5cf6 0%, #6366f1 100%); color: white; '
+    'padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-left: 8px;">AI Booked</span>'
+)
+
+# One label/value row of the Vehicle Health Dashboard box
+HEALTH_DETAIL_TPL = (
+    '<div class="data-row health-detail">'
+    '<span class="data-label">{label}</span>'
+    '<span class="data-value health-value">{value}</span>'
+    '</div>'
+)
+
+
+# Static sidebar markup; the section titles are styled by .sidebar-section-title
+SIDEBAR_SECTION_HTML = MappingProxyType({
+    "vehicle": '<div class="sidebar-section-title first">Vehicle Control</div>',
+    "fault": '<div class="sidebar-section-title">Fault Simulation</div>',
+    "controls": '<div class="sidebar-section-title">Dashboard Controls</div>',
+    "status": '<div class="sidebar-section-title spaced">System Status</div>',
+    "quick_access": '<div class="sidebar-section-title spaced">Quick Access</div>'
+})
+
+MAIN_HEADER_HTML = """
+<div class="main-header">
+    <div class="main-header-brand">
+        <div class="main-header-logo">VC</div>
+        <div>
+            <h1 class="main-header-title">Predictive Maintenance</h1>
+            <p class="main-header-subtitle">Real-time vehicle telemetry monitoring and AI anomaly detection</p>
+        </div>
+    </div>
+    <div class="main-header-live">
+        <span class="status-dot active"></span>
+        <span>Live Monitoring</span>
+    </div>
+</div>
+"""
+
+SIDEBAR_HEADER_HTML = """
+<div style="display: flex; align-items: center; gap: 12px; padding: 8px 0 20px 0; margin-bottom: 8px; border-bottom: 1px solid #27272a;">
+    <div style="width: 40px; height: 40px; background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 14px; font-weight: 700; color: white; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);">VC</div>
+    <div>
+        <div style="font-family: \'Outfit\', sans-serif; font-size: 1.2rem; font-weight: 700; color: #fafafa; letter-spacing: -0.02em;">VehicleCare</div>
+        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.7rem; color: #71717a; text-transform: uppercase; letter-spacing: 0.1em;">AI • Predictive</div>
+    </div>
+</div>
+""" + SIDEBAR_SECTION_HTML["vehicle"]
+
+
+# Center cards on the auto-booking progress page
+WAITING_CENTER_CARD_TPL = """
+<div class="center-card" data-status="waiting">
+    <div class="center-icon" style="font-weight: 600; color: #71717a;">SC</div>
+    <div class="center-info">
+        <div class="center-name">{name}</div>
+        <div class="center-status">Waiting...</div>
+    </div>
+</div>
+"""
+
+CENTER_CARD_TPL = """
+<div class="center-card" data-status="{cls}">
+    <div class="center-icon">{icon}</div>
+    <div class="center-info">
+        <div class="center-name">{name}</div>
+        <div class="center-status">{status}</div>
+    </div>
+</div>
+"""
+
+# Booking progress status -> (card class, icon, status text); any other status
+# (no_answer, busy, failed) shows as no availability
+CENTER_CARD_STATUS = MappingProxyType({
+    "confirmed": ("success", "✓", "Booking Confirmed!"),
+    "calling": ("calling", "●", "Calling..."),
+})
+FAILED_CENTER_CARD_STATUS = ("failed", "×", "No availability")
+
+
+# Helper functions for page rendering
+# Button callbacks. They run before the rerun the click triggers, so the page
+# renders once with the new state instead of rendering and then calling st.rerun()
+def _retry_auto_booking():
+    """Run the auto-booking again from the progress page."""
+    st.session_state.auto_booking_complete = False
+    st.session_state.center_final_status = {}
+
+
+def _leave_auto_booking():
+    """Return from the auto-booking progress page to the dashboard."""
+    st.session_state.current_page = "dashboard"
+    st.session_state.auto_booking_triggered = False
+    st.session_state.auto_booking_complete = False
+    st.session_state.show_notification = False
+
+
+def _leave_schedule_service():
+    """Return from the Schedule Service page to the issue details."""
+    st.session_state.current_page = "issue_details"
+    st.session_state.auto_booking_status = None
+    st.session_state.auto_booking_logs = []
+
+
+def _start_ai_booking_call():
+    """Start the AI booking call on the Schedule Service page."""
+    st.session_state.booking_in_progress = True
+    st.session_state.auto_booking_logs = []
+    st.session_state.auto_booking_status = "initiating"
+
+
+def _load_more_appointments():
+    """Show the next page of appointments on the appointments page."""
+    st.session_state.appointments_page += 1
+
+
+def _record_reading(reading: dict):
+    """
+    Add a scored reading to the history and the chart buffers.
+    
+    Args:
+        reading: Reading with its anomaly flag and score set
+    """
+    st.session_state.readings_history.append(reading)
+    
+    buffers = st.session_state.history_buffers
+    columns = buffers["columns"]
+    end = buffers["end"]
+    
+    # When full, shift the newest HISTORY_LENGTH - 1 rows to the front
+    if end == 2 * HISTORY_LENGTH:
+        keep = HISTORY_LENGTH - 1
+        for column in columns.values():
+            column[:keep] = column[end - keep:end]
+        end = keep
+    
+    sensors = reading["sensors"]
+    columns["timestamp"][end] = np.datetime64(reading["timestamp"])
+    for name in SENSOR_NAMES:
+        columns[name][end] = sensors[name]
+    columns["anomaly"][end] = reading["anomaly"]
+    columns["anomaly_score"][end] = reading["anomaly_score"]
+    buffers["end"] = end + 1
+    st.session_state.chart_stale = True
+
+
+def _history_frame() -> pd.DataFrame:
+    """Return the last HISTORY_LENGTH readings as a DataFrame for the chart."""
+    buffers = st.session_state.history_buffers
+    end = buffers["end"]
+    start = max(0, end - HISTORY_LENGTH)
+    return pd.DataFrame({name: column[start:end] for name, column in buffers["columns"].items()})
+
+
+# Telemetry chart traces in subplot order (row by row):
+# (history column, subplot title, trace name, line color, y-axis title,
+#  threshold lines as (y, color, label))
+TELEMETRY_TRACES = (
+    ("engine_rpm", "Engine RPM", "RPM", "blue", "RPM", (
+        (3000, "orange", "Max Normal"),
+    )),
+    ("engine_temp_c", "Engine Temperature", "Temp (°C)", "red", "°C", (
+        (105, "orange", "Max Normal"),
+        (120, "red", "Critical")
+    )),
+    ("vibration_level_g", "Vibration Level", "Vibration (g)", "purple", "g", (
+        (0.4, "orange", "Max Normal"),
+        (1.0, "red", "Critical")
+    )),
+    ("throttle_pos_pct", "Throttle Position", "Throttle (%)", "green", "%", ()),
+    ("battery_voltage_v", "Battery Voltage", "Battery (V)", "orange", "V", (
+        (13.5, "green", "Min Normal"),
+        (14.5, "green", "Max Normal")
+    )),
+    ("anomaly_score", "Anomaly Score", "Anomaly Score", "gray", "Score", (
+        (0, "red", "Anomaly Threshold"),
+    ))
+)
+
+# History column plotted by each telemetry chart trace, in trace order
+TELEMETRY_TRACE_COLUMNS = tuple(trace[0] for trace in TELEMETRY_TRACES)
+
+# Telemetry chart grid, with better spacing
+TELEMETRY_SUBPLOTS = MappingProxyType({
+    "rows": 3,
+    "cols": 2,
+    "subplot_titles": tuple(trace[1] for trace in TELEMETRY_TRACES),
+    "vertical_spacing": 0.15,
+    "horizontal_spacing": 0.12,
+    "row_heights": (0.33, 0.33, 0.34)
+})
+
+# Telemetry chart layout with dark theme styling
+TELEMETRY_LAYOUT = MappingProxyType({
+    "height": 1000,
+    "showlegend": False,
+    "title_text": "Vehicle Telemetry Dashboard",
+    "title_x": 0.5,
+    "margin": dict(l=50, r=50, t=80, b=50),
+    "paper_bgcolor": 'rgba(28, 28, 31, 1)',
+    "plot_bgcolor": 'rgba(24, 24, 27, 1)',
+    "font": dict(color='#a1a1aa', family='Outfit, sans-serif'),
+    "title_font": dict(color='#fafafa', size=18, family='Outfit, sans-serif')
+})
+
+# Dark theme styling shared by every telemetry chart axis
+TELEMETRY_AXIS_STYLE = MappingProxyType({
+    "gridcolor": '#27272a',
+    "linecolor": '#3f3f46',
+    "tickfont": dict(color='#71717a'),
+    "title_font": dict(color='#a1a1aa')
+})
+
+
+def _build_telemetry_figure() -> go.Figure:
+    """
+    Build the dashboard telemetry chart with empty traces.
     
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
+    The subplots, threshold lines and styling are set up once per session;
+    each rerun only replaces the trace data.
     
-    /* Premium Cards */
-    .premium-card {
-        background: var(--bg-card);
-        border: 1px solid var(--border-subtle);
-        border-radius: var(--radius-lg);
-        padding: 24px;
-        margin: 16px 0;
-        transition: all 0.2s ease;
-    }
+    Returns:
+        Plotly figure with one trace per TELEMETRY_TRACES entry
+    """
+    fig = make_subplots(**TELEMETRY_SUBPLOTS)
     
-    .premium-card:hover {
-        background: var(--bg-card-hover);
-        border-color: var(--border-medium);
-        transform: translateY(-2px);
-        box-shadow: var(--shadow-md);
-    }
+    for idx, (_, _, name, color, y_title, thresholds) in enumerate(TELEMETRY_TRACES):
+        row, col = idx // 2 + 1, idx % 2 + 1
+        fig.add_trace(
+            go.Scattergl(
+                mode="lines",
+                name=name,
+                line=dict(color=color, width=2)
+            ),
+            row=row, col=col
+        )
+        for y, line_color, label in thresholds:
+            fig.add_hline(y=y, line_dash="dash", line_color=line_color, row=row, col=col, annotation_text=label)
+        fig.update_xaxes(title_text="Time", row=row, col=col)
+        fig.update_yaxes(title_text=y_title, row=row, col=col)
     
-    .premium-card-header {
-        display: flex;
-        align-items: center;
-        gap: 12px;
-        margin-bottom: 16px;
-        padding-bottom: 16px;
-        border-bottom: 1px solid var(--border-subtle);
-    }
+    # Only the Anomaly Score trace draws markers, colored by anomaly status
+    fig.data[-1].mode = "lines+markers"
+    fig.data[-1].marker.size = 8
     
-    .premium-card-icon {
-        width: 44px;
-        height: 44px;
-        border-radius: 10px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 20px;
-        background: var(--bg-tertiary);
-    }
+    fig.update_layout(**TELEMETRY_LAYOUT)
+    fig.update_xaxes(**TELEMETRY_AXIS_STYLE)
+    fig.update_yaxes(**TELEMETRY_AXIS_STYLE)
     
-    .premium-card-title {
-        font-family: 'Outfit', sans-serif;
-        font-size: 1rem;
-        font-weight: 600;
-        color: var(--text-primary);
+    return fig
+
+
+def _open_auto_booking():
+    """Switch to the auto-booking progress page with a fresh booking."""
+    st.session_state.auto_booking_triggered = False  # Reset for new booking
+    st.session_state.auto_booking_complete = False
+    st.session_state.center_final_status = {}
+    st.session_state.current_page = "auto_booking_progress"
+
+
+def _report_anomaly(reading: dict):
+    """
+    Record an anomalous reading and start auto-booking for it.
+    
+    On the dashboard this switches straight to the auto-booking progress page;
+    elsewhere the notification waits until the user returns to the dashboard.
+    
+    Args:
+        reading: The reading flagged as anomalous
+    """
+    recommendation = analyze_anomaly(reading)
+    anomaly_data = {
+        "timestamp": reading["timestamp"],
+        "reading": reading,
+        "recommendation": recommendation
     }
+    st.session_state.anomalies_detected.append(anomaly_data)
     
-    .premium-card-subtitle {
-        font-family: 'Outfit', sans-serif;
-        font-size: 0.8rem;
-        color: var(--text-muted);
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
+    # Set current issue and show notification
+    st.session_state.current_issue = anomaly_data
+    st.session_state.show_notification = True
+    if st.session_state.current_page == "dashboard":
+        _open_auto_booking()
+
+
+def _generate_reading():
+    """Generate and score one reading for the "Generate New Reading" button."""
+    # Sync detector history before detection (if method exists)
+    if hasattr(st.session_state.detector, 'sync_history'):
+        st.session_state.detector.sync_history(st.session_state.readings_history)
     
-    .premium-card-content {
-        color: var(--text-secondary);
-        font-size: 0.95rem;
-        line-height: 1.6;
-    }
+    reading = st.session_state.simulator.generate_reading()
+    anomaly, score = st.session_state.detector.detect_and_score(reading)
     
-    /* Severity Badges */
-    .severity-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 6px;
-        padding: 8px 16px;
-        border-radius: 8px;
-        font-size: 0.875rem;
-        font-weight: 600;
-        font-family: 'Outfit', sans-serif;
-    }
+    reading["anomaly"] = anomaly
+    reading["anomaly_score"] = score
+    _record_reading(reading)
     
-    .severity-critical {
-        background: rgba(239, 68, 68, 0.15);
-        color: #f87171;
-        border: 1px solid rgba(239, 68, 68, 0.3);
-    }
+    if anomaly == -1:
+        _report_anomaly(reading)
+
+
+@lru_cache(maxsize=64)
+def _sidebar_status_html(readings_count: int, anomalies_count: int) -> str:
+    """
+    Render the sidebar System Status title and counters.
+    
+    Cached on the counts, which only change when a reading arrives.
+    
+    Args:
+        readings_count: Number of readings in the history
+        anomalies_count: Number of anomalies detected
+        
+    Returns:
+        HTML for the status cards
+    """
+    return SIDEBAR_SECTION_HTML["status"] + f'''
+    <div style="display: grid; gap: 8px;">
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 10px 12px; background: #1c1c1f; border: 1px solid #27272a; border-radius: 8px;">
+            <span style="font-family: \'Outfit\', sans-serif; font-size: 0.8rem; color: #a1a1aa;">Readings</span>
+            <span style="font-family: \'IBM Plex Mono\', monospace; font-size: 0.9rem; color: #fafafa; font-weight: 600;">{readings_count}</span>
+        </div>
+        <div style="display: flex; justify-content: space-between; align-items: center; padding: 10px 12px; background: #1c1c1f; border: 1px solid {'rgba(239, 68, 68, 0.3)' if anomalies_count > 0 else '#27272a'}; border-radius: 8px;">
+            <span style="font-family: \'Outfit\', sans-serif; font-size: 0.8rem; color: #a1a1aa;">Anomalies</span>
+            <span style="font-family: \'IBM Plex Mono\', monospace; font-size: 0.9rem; color: {'#f87171' if anomalies_count > 0 else '#fafafa'}; font-weight: 600;">{anomalies_count}</span>
+        </div>
+    </div>
+    '''
+
+
+def _render_sidebar_status():
+    """Render the sidebar System Status counters from the current history."""
+    readings_count = len(st.session_state.readings_history)
+    anomalies_count = len(st.session_state.anomalies_detected)
+    st.markdown(_sidebar_status_html(readings_count, anomalies_count), unsafe_allow_html=True)
+
+
+def _issue_summary(issue: dict) -> tuple:
+    """
+    Get the details and severity of a detected anomaly.
     
-    .severity-high {
-        background: rgba(245, 158, 11, 0.15);
-        color: #fbbf24;
-        border: 1px solid rgba(245, 158, 11, 0.3);
-    }
+    They are computed on first use and kept on the anomaly record, so the
+    pages showing the current issue do not redo it on every rerun.
     
-    .severity-medium {
-        background: rgba(6, 182, 212, 0.15);
-        color: #22d3ee;
-        border: 1px solid rgba(6, 182, 212, 0.3);
-    }
+    Args:
+        issue: Anomaly record with the triggering reading
+        
+    Returns:
+        Tuple of (issue_title, issue_description, recommended_action, severity)
+    """
+    summary = issue.get("summary")
+    if summary is None:
+        reading = issue["reading"]
+        summary = (*get_issue_details(reading), get_severity_level(reading))
+        issue["summary"] = summary
+    return summary
+
+
+def _add_appointment(appointment: dict):
+    """
+    Record a new appointment and make it the latest one.
+    
+    The display dates are formatted here once, so the confirmation and
+    appointments pages do not call strftime on every rerun.
+    
+    Args:
+        appointment: Appointment details including its date
+    """
+    appointment["date_long"] = appointment["date"].strftime("%A, %B %d, %Y")
+    appointment["date_short"] = appointment["date"].strftime("%B %d, %Y")
+    st.session_state.appointments.append(appointment)
+    st.session_state.latest_appointment = appointment
+
+
+def _center_card_html(center_name: str, progress=None) -> str:
+    """
+    Render the card for one service center.
+    
+    Args:
+        center_name: Service center name
+        progress: Latest AutoBookingProgress for the center, or None if it
+            has not been called yet
+        
+    Returns:
+        HTML for the center card
+    """
+    if progress is None:
+        # Center not yet called
+        return WAITING_CENTER_CARD_TPL.format(name=center_name)
+    
+    card_class, icon, status_text = CENTER_CARD_STATUS.get(progress.status, FAILED_CENTER_CARD_STATUS)
+    return CENTER_CARD_TPL.format(cls=card_class, icon=icon, name=center_name, status=status_text)
+
+
+@st.fragment(run_every=1)
+def _booking_transition():
+    """
+    Rerun the app one second after the issue page starts auto-booking.
+    
+    The first call only renders; the fragment's own timer then reruns it
+    and the full-app rerun shows the auto-booking progress page.
+    """
+    if st.session_state.get("booking_transition_pending"):
+        st.session_state.booking_transition_pending = False
+    else:
+        st.rerun()
+
+
+def _start_booking_job(run_booking, updates: queue.Queue, booking_request: BookingRequest,
+                       service_type: str) -> dict:
+    """
+    Run a booking coroutine on a background thread.
+    
+    Args:
+        run_booking: Coroutine function performing the booking
+        updates: Queue the booking's status callback writes call-log entries to
+        booking_request: The request the booking call was started with
+        service_type: Service type selected when the call was started
+        
+    Returns:
+        Job dict with the thread, the updates queue, the request, and the
+        result or error once the thread has finished
+    """
+    job = {"updates": updates, "booking_request": booking_request, "service_type": service_type,
+           "result": None, "error": None}
+    
+    def target():
+        try:
+            job["result"] = asyncio.run(run_booking())
+        except Exception as e:
+            job["error"] = e
     
-    .severity-low {
-        background: rgba(16, 185, 129, 0.15);
-        color: #34d399;
-        border: 1px solid rgba(16, 185, 129, 0.3);
-    }
+    job["thread"] = threading.Thread(target=target, daemon=True)
+    job["thread"].start()
+    return job
+
+
+def _finish_booking_job(job: dict) -> Optional[str]:
+    """
+    Record the outcome of a finished booking job and clear it from the session.
     
-    /* Monospace Values */
-    .mono-value {
-        font-family: 'IBM Plex Mono', monospace;
-        font-weight: 500;
-        color: var(--text-primary);
-    }
+    The appointment is built from the request the call was started with, since
+    the form may have been edited while the call was running.
     
-    /* Animated Gradient Text */
-    .gradient-text {
-        background: var(--accent-gradient);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        background-clip: text;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Initialize session state
-if "simulator" not in st.session_state:
-    st.session_state.simulator = VehicleSimulator()
-if "detector" not in st.session_state:
-    st.session_state.detector = AnomalyDetector()
-elif not hasattr(st.session_state.detector, 'sync_history'):
-    # Recreate detector if it's an old version without sync_history method
-    # Preserve training state if model was already trained
-    was_trained = st.session_state.detector.is_trained
-    st.session_state.detector = AnomalyDetector()
-    if was_trained:
-        # Retrain the model
-        st.session_state.model_trained = False
-if "model_trained" not in st.session_state:
-    st.session_state.model_trained = False
-if "readings_history" not in st.session_state:
-    st.session_state.readings_history = []
-if "anomalies_detected" not in st.session_state:
-    st.session_state.anomalies_detected = []
-if "auto_update" not in st.session_state:
-    st.session_state.auto_update = True  # Start with auto-update enabled
-if "update_interval" not in st.session_state:
-    st.session_state.update_interval = 5  # Default to 5 seconds
-if "last_update_time" not in st.session_state:
-    st.session_state.last_update_time = time.time()
-if "current_page" not in st.session_state:
-    st.session_state.current_page = "dashboard"  # dashboard, issue_details, schedule_service, confirmation
-if "current_issue" not in st.session_state:
-    st.session_state.current_issue = None
-if "appointments" not in st.session_state:
-    st.session_state.appointments = []
-if "latest_appointment" not in st.session_state:
-    st.session_state.latest_appointment = None
-if "show_notification" not in st.session_state:
-    st.session_state.show_notification = False
-if "auto_booking_status" not in st.session_state:
-    st.session_state.auto_booking_status = None
-if "auto_booking_result" not in st.session_state:
-    st.session_state.auto_booking_result = None
-if "auto_booking_logs" not in st.session_state:
-    st.session_state.auto_booking_logs = []
-if "booking_in_progress" not in st.session_state:
+    Args:
+        job: Job dict from _start_booking_job() whose thread has finished
+        
+    Returns:
+        Error message if the booking failed, None if an appointment was added
+    """
+    st.session_state.booking_job = None
     st.session_state.booking_in_progress = False
-if "auto_booking_triggered" not in st.session_state:
-    st.session_state.auto_booking_triggered = False
-if "auto_booking_complete" not in st.session_state:
-    st.session_state.auto_booking_complete = False
-if "calling_centers_progress" not in st.session_state:
-    st.session_state.calling_centers_progress = []
+    
+    if job["error"] is not None:
+        return f"Error during booking: {str(job['error'])}"
+    
+    result = job["result"]
+    st.session_state.auto_booking_result = result
+    if result.status != BookingStatus.CONFIRMED:
+        return f"Booking failed: {result.notes}"
+    
+    # Create appointment from result
+    booking_request = job["booking_request"]
+    _add_appointment({
+        "service_center": booking_request.service_center_name,
+        "service_type": job["service_type"],
+        "date": booking_request.preferred_date.date(),
+        "time": result.scheduled_time or booking_request.preferred_time,
+        "customer_name": booking_request.customer_name,
+        "customer_phone": booking_request.customer_phone,
+        "customer_email": booking_request.customer_email,
+        "issue": booking_request.issue_type,
+        "status": "Confirmed (AI Booked)",
+        "confirmation_number": result.confirmation_number,
+        "booking_method": "Automated AI Call",
+        "call_transcript": result.call_transcript,
+        "created_at": datetime.now()
+    })
+    return None
 
-# Default customer info (would come from user profile in production)
-if "customer_info" not in st.session_state:
-    st.session_state.customer_info = {
-        "name": "John Doe",
-        "phone": "+1 (555) 123-4567",
-        "email": "john.doe@example.com"
-    }
 
-# Check if model is already trained (loaded from disk or in session)
-if not st.session_state.model_trained:
-    # Check if detector already loaded models from disk
-    if st.session_state.detector.is_trained:
-        st.session_state.model_trained = True
-        st.success("✓ Loaded pre-trained model from disk.")
-    else:
-        # Only train if no saved model exists
-        with st.spinner("Training anomaly detection model on normal vehicle data... (This only happens once)"):
-            st.session_state.detector.train_initial_model(n_samples=1000)
-            st.session_state.model_trained = True
-            st.success("Model trained and saved successfully!")
+def _poll_booking_job():
+    """Rerun the app when the running booking has new call-log entries or has finished."""
+    job = st.session_state.booking_job
+    if job is None or not job["updates"].empty() or not job["thread"].is_alive():
+        st.rerun()
 
 
-# Helper functions for page rendering
 def render_issue_details_page():
     """Render the Issue Detected page with premium dark design."""
     
     # Get issue data first
     if st.session_state.current_issue:
         issue = st.session_state.current_issue
-        reading = issue["reading"]
-        issue_title, issue_description, recommended_action = get_issue_details(reading)
-        severity = get_severity_level(reading)
+        issue_title, issue_description, recommended_action, severity = _issue_summary(issue)
         
         # Determine severity styling for dark theme
-        severity_styles = {
-            "Critical": {"class": "severity-critical", "icon": "●", "glow": "#ef4444"},
-            "High": {"class": "severity-high", "icon": "●", "glow": "#f59e0b"},
-            "Medium": {"class": "severity-medium", "icon": "●", "glow": "#06b6d4"},
-            "Low": {"class": "severity-low", "icon": "●", "glow": "#10b981"}
-        }
-        sev_style = severity_styles.get(severity, severity_styles["Medium"])
+        sev_style = SEVERITY_STYLES.get(severity, SEVERITY_STYLES["Medium"])
     else:
         issue_title = "No Issue"
         issue_description = "No issue data available."
         recommended_action = "Return to dashboard."
         severity = "Unknown"
-        sev_style = {"class": "severity-medium", "icon": "○", "glow": "#71717a"}
-    
-    # Premium Dark Theme Styles
-    st.markdown(
-        f"""
-        <style>
-        .issue-container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }}
-        
-        .issue-header {{
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            margin-bottom: 32px;
-            padding-bottom: 24px;
-            border-bottom: 1px solid #27272a;
-        }}
-        
-        .issue-logo-icon {{
-            width: 56px;
-            height: 56px;
-            background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-            border-radius: 14px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 28px;
-            box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);
-        }}
-        
-        .issue-header-text {{
-            flex: 1;
-        }}
-        
-        .issue-header-title {{
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #fafafa;
-            letter-spacing: -0.02em;
-        }}
-        
-        .issue-header-subtitle {{
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.875rem;
-            color: #71717a;
-            margin-top: 4px;
-        }}
-        
-        .alert-banner {{
-            background: linear-gradient(135deg, rgba(239, 68, 68, 0.1) 0%, rgba(239, 68, 68, 0.05) 100%);
-            border: 1px solid rgba(239, 68, 68, 0.2);
-            border-radius: 12px;
-            padding: 16px 20px;
-            margin-bottom: 24px;
-            display: flex;
-            align-items: center;
-            gap: 12px;
-        }}
-        
-        .alert-banner-icon {{
-            font-size: 24px;
-            animation: pulse-alert 2s ease-in-out infinite;
-        }}
-        
-        @keyframes pulse-alert {{
-            0%, 100% {{ opacity: 1; transform: scale(1); }}
-            50% {{ opacity: 0.7; transform: scale(1.1); }}
-        }}
-        
-        .alert-banner-text {{
-            font-family: 'Outfit', sans-serif;
-            color: #fca5a5;
-            font-size: 0.95rem;
-            font-weight: 500;
-        }}
-        
-        .issue-card {{
-            background: #1c1c1f;
-            border: 1px solid #27272a;
-            border-radius: 16px;
-            padding: 24px;
-            margin-bottom: 16px;
-            transition: all 0.2s ease;
-        }}
-        
-        .issue-card:hover {{
-            background: #222225;
-            border-color: #3f3f46;
-            transform: translateY(-2px);
-        }}
-        
-        .issue-card-header {{
-            display: flex;
-            align-items: center;
-            gap: 14px;
-            margin-bottom: 16px;
-        }}
-        
-        .issue-card-icon {{
-            width: 44px;
-            height: 44px;
-            border-radius: 10px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 20px;
-        }}
-        
-        .issue-card-icon.danger {{
-            background: rgba(239, 68, 68, 0.15);
-            box-shadow: 0 0 20px rgba(239, 68, 68, 0.1);
-        }}
-        
-        .issue-card-icon.info {{
-            background: rgba(6, 182, 212, 0.15);
-            box-shadow: 0 0 20px rgba(6, 182, 212, 0.1);
-        }}
-        
-        .issue-card-icon.action {{
-            background: rgba(16, 185, 129, 0.15);
-            box-shadow: 0 0 20px rgba(16, 185, 129, 0.1);
-        }}
-        
-        .issue-card-label {{
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.7rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.08em;
-            color: #71717a;
-        }}
-        
-        .issue-card-title {{
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #fafafa;
-            margin-top: 2px;
-        }}
-        
-        .issue-card-content {{
-            font-family: 'Outfit', sans-serif;
-            color: #a1a1aa;
-            font-size: 0.95rem;
-            line-height: 1.7;
-        }}
-        
-        .severity-row {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 12px 0;
-        }}
-        
-        .severity-label {{
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.9rem;
-        }}
-        
-        .action-box {{
-            background: rgba(16, 185, 129, 0.08);
-            border-left: 3px solid #10b981;
-            padding: 16px 20px;
-            border-radius: 0 10px 10px 0;
-            margin-top: 8px;
-        }}
-        
-        .action-box p {{
-            font-family: 'Outfit', sans-serif;
-            color: #34d399;
-            font-size: 0.95rem;
-            line-height: 1.6;
-            margin: 0;
-        }}
-        
-        .booking-status {{
-            background: linear-gradient(135deg, rgba(16, 185, 129, 0.1) 0%, rgba(6, 182, 212, 0.1) 100%);
-            border: 1px solid rgba(16, 185, 129, 0.2);
-            border-radius: 12px;
-            padding: 20px;
-            text-align: center;
-            margin-top: 24px;
-        }}
-        
-        .booking-status-icon {{
-            font-size: 32px;
-            margin-bottom: 12px;
-        }}
-        
-        .booking-status-text {{
-            font-family: 'Outfit', sans-serif;
-            color: #34d399;
-            font-size: 1rem;
-            font-weight: 500;
-        }}
-        
-        .booking-status-subtext {{
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.85rem;
-            margin-top: 8px;
-        }}
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
+        sev_style = NO_ISSUE_SEVERITY_STYLE
     
     # Back button with premium styling
     col1, col2, col3 = st.columns([1, 6, 1])
@@ -852,330 +946,47 @@ def render_issue_details_page():
             st.session_state.show_notification = False
             st.rerun()
     
-    st.markdown('<div class="issue-container">', unsafe_allow_html=True)
+    # The page body is plain HTML, so it is assembled and emitted in one st.html call
+    html_parts = ['<div class="issue-container">']
     
     # Header
-    st.markdown('''
-        <div class="issue-header">
-            <div class="issue-logo-icon" style="font-size: 18px; font-weight: 700; color: white;">VC</div>
-            <div class="issue-header-text">
-                <div class="issue-header-title">VehicleCare AI</div>
-                <div class="issue-header-subtitle">Predictive Maintenance Alert</div>
-            </div>
-        </div>
-    ''', unsafe_allow_html=True)
+    html_parts.append(ISSUE_HEADER_HTML)
     
     if st.session_state.current_issue:
         # Alert Banner
-        st.markdown(f'''
-            <div class="alert-banner">
-                <span class="alert-banner-icon" style="color: #fca5a5; font-weight: bold;">!</span>
-                <span class="alert-banner-text">Anomaly detected - Automated service booking initiated</span>
-            </div>
-        ''', unsafe_allow_html=True)
+        html_parts.append(ISSUE_ALERT_HTML)
         
         # Issue Detected Card
-        st.markdown(f'''
-            <div class="issue-card">
-                <div class="issue-card-header">
-                    <div class="issue-card-icon danger" style="font-weight: bold; color: #f87171;">!</div>
-                    <div>
-                        <div class="issue-card-label">Issue Identified</div>
-                        <div class="issue-card-title">{issue_title}</div>
-                    </div>
-                </div>
-                <div class="issue-card-content">{issue_description}</div>
-            </div>
-        ''', unsafe_allow_html=True)
+        html_parts.append(ISSUE_CARD_TPL.format(
+            title=html_escape(issue_title),
+            description=html_escape(issue_description),
+        ))
         
-        # Severity Card
-        st.markdown(f'''
-            <div class="issue-card">
-                <div class="issue-card-header">
-                    <div class="issue-card-icon info" style="font-weight: bold; color: #22d3ee;">i</div>
-                    <div>
-                        <div class="issue-card-label">Diagnostic Analysis</div>
-                        <div class="issue-card-title">Severity Assessment</div>
-                    </div>
-                </div>
-                <div class="severity-row">
-                    <span class="severity-label">Risk Level</span>
-                    <span class="{sev_style['class']}">{sev_style['icon']} {severity}</span>
-                </div>
-            </div>
-        ''', unsafe_allow_html=True)
+        # Severity Card (severities without their own style use the Medium one)
+        severity_badge = SEVERITY_BADGE_HTML.get(severity) or _severity_badge(sev_style, severity)
+        html_parts.append(SEVERITY_CARD_TPL.format(badge=severity_badge))
         
         # Action Card with Auto-booking status
-        st.markdown(f'''
-            <div class="issue-card">
-                <div class="issue-card-header">
-                    <div class="issue-card-icon action" style="font-weight: bold; color: #34d399;">AI</div>
-                    <div>
-                        <div class="issue-card-label">Automated Response</div>
-                        <div class="issue-card-title">AI Service Booking</div>
-                    </div>
-                </div>
-                <div class="action-box">
-                    <p>VehicleCare AI is automatically contacting service centers to schedule your appointment. No action required.</p>
-                </div>
-            </div>
-            
-            <div class="booking-status">
-                <div class="booking-status-icon" style="font-size: 24px; color: #34d399;">●</div>
-                <div class="booking-status-text">Initiating automated booking...</div>
-                <div class="booking-status-subtext">Calling service centers to find the best available slot</div>
-            </div>
-        ''', unsafe_allow_html=True)
-        
-        # Auto-trigger booking
-        if not st.session_state.auto_booking_triggered:
-            st.session_state.auto_booking_triggered = True
-            st.session_state.current_page = "auto_booking_progress"
-            time.sleep(1)  # Brief pause for UX
-            st.rerun()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+        html_parts.append(ISSUE_ACTION_HTML)
+    
+    html_parts.append('</div>')
+    st.html("".join(html_parts))
+    
+    # Auto-trigger booking
+    if st.session_state.current_issue and not st.session_state.auto_booking_triggered:
+        st.session_state.auto_booking_triggered = True
+        st.session_state.current_page = "auto_booking_progress"
+        # Brief pause for UX, without holding the script thread
+        st.session_state.booking_transition_pending = True
+        _booking_transition()
 
 
 def render_auto_booking_progress_page():
     """Render the Auto-Booking Progress page with premium dark design."""
     
-    st.markdown(
-        """
-        <style>
-        .booking-container {
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .booking-header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 24px;
-            border-bottom: 1px solid #27272a;
-        }
-        
-        .booking-logo-row {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 12px;
-            margin-bottom: 20px;
-        }
-        
-        .booking-logo-icon {
-            width: 48px;
-            height: 48px;
-            background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-            border-radius: 12px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 24px;
-            box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);
-        }
-        
-        .booking-logo-text {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #fafafa;
-        }
-        
-        .booking-title {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: #fafafa;
-            margin-bottom: 8px;
-        }
-        
-        .booking-subtitle {
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.95rem;
-        }
-        
-        .progress-indicator {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 12px;
-            margin: 24px 0;
-            padding: 16px;
-            background: rgba(16, 185, 129, 0.08);
-            border: 1px solid rgba(16, 185, 129, 0.2);
-            border-radius: 12px;
-        }
-        
-        .progress-spinner {
-            width: 24px;
-            height: 24px;
-            border: 3px solid #27272a;
-            border-top-color: #10b981;
-            border-radius: 50%;
-            animation: spin 1s linear infinite;
-        }
-        
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-        
-        .progress-text {
-            font-family: 'Outfit', sans-serif;
-            color: #34d399;
-            font-size: 0.95rem;
-            font-weight: 500;
-        }
-        
-        .center-card {
-            background: #1c1c1f;
-            border: 1px solid #27272a;
-            border-radius: 12px;
-            padding: 18px 20px;
-            margin: 10px 0;
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            transition: all 0.3s ease;
-        }
-        
-        .center-card.calling {
-            border-color: #06b6d4;
-            background: rgba(6, 182, 212, 0.08);
-            animation: glow-pulse 2s ease-in-out infinite;
-        }
-        
-        @keyframes glow-pulse {
-            0%, 100% { box-shadow: 0 0 0 0 rgba(6, 182, 212, 0); }
-            50% { box-shadow: 0 0 20px 0 rgba(6, 182, 212, 0.3); }
-        }
-        
-        .center-card.success {
-            border-color: #10b981;
-            background: rgba(16, 185, 129, 0.1);
-            box-shadow: 0 0 30px rgba(16, 185, 129, 0.2);
-        }
-        
-        .center-card.failed {
-            border-color: #3f3f46;
-            background: #18181b;
-            opacity: 0.6;
-        }
-        
-        .center-card.waiting {
-            opacity: 0.4;
-        }
-        
-        .center-icon {
-            font-size: 24px;
-            width: 44px;
-            height: 44px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            border-radius: 10px;
-            background: #27272a;
-        }
-        
-        .center-icon.calling {
-            background: rgba(6, 182, 212, 0.15);
-            animation: phone-ring 1s ease-in-out infinite;
-        }
-        
-        @keyframes phone-ring {
-            0%, 100% { transform: rotate(0deg); }
-            25% { transform: rotate(15deg); }
-            75% { transform: rotate(-15deg); }
-        }
-        
-        .center-icon.success {
-            background: rgba(16, 185, 129, 0.15);
-        }
-        
-        .center-info {
-            flex: 1;
-        }
-        
-        .center-name {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1rem;
-            font-weight: 600;
-            color: #fafafa;
-        }
-        
-        .center-status {
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.8rem;
-            color: #71717a;
-            margin-top: 4px;
-        }
-        
-        .center-status.calling {
-            color: #22d3ee;
-            font-weight: 500;
-        }
-        
-        .center-status.success {
-            color: #34d399;
-            font-weight: 600;
-        }
-        
-        .center-status.failed {
-            color: #ef4444;
-        }
-        
-        .call-animation {
-            display: inline-block;
-            animation: ring 1s ease-in-out infinite;
-        }
-        
-        @keyframes ring {
-            0%, 100% { transform: rotate(0deg); }
-            25% { transform: rotate(15deg); }
-            75% { transform: rotate(-15deg); }
-        }
-        .center-status.failed {
-            color: #71717a;
-        }
-        
-        .success-banner {
-            background: linear-gradient(135deg, rgba(16, 185, 129, 0.15) 0%, rgba(6, 182, 212, 0.1) 100%);
-            border: 1px solid rgba(16, 185, 129, 0.3);
-            border-radius: 16px;
-            padding: 24px;
-            text-align: center;
-            margin-top: 24px;
-        }
-        
-        .success-icon {
-            font-size: 48px;
-            margin-bottom: 16px;
-        }
-        
-        .success-title {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.25rem;
-            font-weight: 700;
-            color: #34d399;
-            margin-bottom: 8px;
-        }
-        
-        .success-subtitle {
-            font-family: 'Outfit', sans-serif;
-            color: #a1a1aa;
-            font-size: 0.9rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-    
-    st.markdown('<div class="booking-container">', unsafe_allow_html=True)
-    
     # Header
-    st.markdown('''
+    st.html('''
+        <div class="booking-container">
         <div class="booking-header">
             <div class="booking-logo-row">
                 <div class="booking-logo-icon" style="font-size: 16px; font-weight: 700; color: white;">VC</div>
@@ -1184,55 +995,73 @@ def render_auto_booking_progress_page():
             <div class="booking-title">Automated Booking in Progress</div>
             <div class="booking-subtitle">AI is calling service centers to find the best available appointment</div>
         </div>
-    ''', unsafe_allow_html=True)
+        </div>
+    ''')
     
     # Get issue info
     if st.session_state.current_issue:
         issue = st.session_state.current_issue
-        reading = issue["reading"]
-        issue_title, issue_description, _ = get_issue_details(reading)
-        severity = get_severity_level(reading)
+        issue_title, issue_description, _, severity = _issue_summary(issue)
         
         # Show issue summary
-        st.info(f"**Issue:** {issue_title} | **Severity:** {severity}")
+        st.info(f"Issue: {issue_title} | Severity: {severity}", icon="⚠️")
         
-        # Initialize progress tracking
-        service_centers = list(SERVICE_CENTER_DIRECTORY.keys())
-        
-        # Progress placeholder
+        # One placeholder per center, so an update only redraws that center's card
         progress_container = st.container()
+        with progress_container:
+            center_slots = {center: st.empty() for center in SERVICE_CENTERS}
         status_placeholder = st.empty()
         
         # Run the auto-booking process
         if not st.session_state.auto_booking_complete:
             
             # Show initial state - all centers waiting
-            with progress_container:
-                for idx, center in enumerate(service_centers):
-                    st.markdown(f'''
-                        <div class="center-card waiting">
-                            <div class="center-icon" style="font-weight: 600; color: #71717a;">SC</div>
-                            <div class="center-info">
-                                <div class="center-name">{center}</div>
-                                <div class="center-status">Waiting...</div>
-                            </div>
-                        </div>
-                    ''', unsafe_allow_html=True)
+            for center, slot in center_slots.items():
+                slot.html(_center_card_html(center))
             
-            # Run the booking
-            progress_updates = []
+            # Run the booking, keeping only the latest update for each center
+            center_final_status = {}
             
             def progress_callback(progress: AutoBookingProgress):
-                progress_updates.append(progress)
+                last = center_final_status.get(progress.current_center)
+                center_final_status[progress.current_center] = progress
+                if last and last.status == progress.status:
+                    # Same status again: nothing to redraw
+                    return
+                
+                slot = center_slots.get(progress.current_center)
+                if slot is not None:
+                    slot.html(_center_card_html(progress.current_center, progress))
             
             # Execute auto-booking
             try:
                 customer = st.session_state.customer_info
+                vehicle_id = st.session_state.simulator.vehicle_id
+                
+                # A booking confirmed moments ago for the same request is reused
+                # rather than calling the service centers again
+                booking_key = (customer["name"], customer["phone"], customer["email"],
+                               vehicle_id, issue_title, severity)
+                # Expired bookings are dropped here, so the dict stays small
+                now = time.time()
+                st.session_state.confirmed_bookings = {
+                    key: booking for key, booking in st.session_state.confirmed_bookings.items()
+                    if now - booking["booked_at"] < BOOKING_REUSE_TTL
+                }
+                confirmed = st.session_state.confirmed_bookings.get(booking_key)
+                if confirmed:
+                    st.session_state.auto_booking_result = confirmed["result"]
+                    st.session_state.auto_booking_complete = True
+                    st.session_state.center_final_status = confirmed["center_final_status"]
+                    st.session_state.latest_appointment = confirmed["appointment"]
+                    st.session_state.current_page = "confirmation"
+                    st.rerun()
+                
                 result = run_auto_booking_sync(
                     customer_name=customer["name"],
                     customer_phone=customer["phone"],
                     customer_email=customer["email"],
-                    vehicle_id=st.session_state.simulator.vehicle_id,
+                    vehicle_id=vehicle_id,
                     issue_type=issue_title,
                     issue_description=issue_description,
                     severity=severity,
@@ -1244,7 +1073,7 @@ def render_auto_booking_progress_page():
                 
                 st.session_state.auto_booking_result = result
                 st.session_state.auto_booking_complete = True
-                st.session_state.calling_centers_progress = progress_updates
+                st.session_state.center_final_status = center_final_status
                 
                 if result.status == BookingStatus.CONFIRMED:
                     # Create appointment
@@ -1264,8 +1093,13 @@ def render_auto_booking_progress_page():
                         "created_at": datetime.now()
                     }
                     
-                    st.session_state.appointments.append(appointment)
-                    st.session_state.latest_appointment = appointment
+                    _add_appointment(appointment)
+                    st.session_state.confirmed_bookings[booking_key] = {
+                        "booked_at": time.time(),
+                        "appointment": appointment,
+                        "result": result,
+                        "center_final_status": center_final_status
+                    }
                     st.session_state.current_page = "confirmation"
                     st.rerun()
                 else:
@@ -1276,194 +1110,32 @@ def render_auto_booking_progress_page():
                 status_placeholder.error(f"Booking failed: {str(e)}")
         
         # Show final progress - only show final status per center (not duplicates)
-        if st.session_state.calling_centers_progress:
-            progress_container.empty()
-            
-            # Get only the final status for each center (skip "calling" if there's a result)
-            final_status_per_center = {}
-            for progress in st.session_state.calling_centers_progress:
-                center = progress.current_center
-                # Always update - later statuses override earlier ones
-                final_status_per_center[center] = progress
-            
-            with progress_container:
-                for center_name in service_centers:
-                    if center_name in final_status_per_center:
-                        progress = final_status_per_center[center_name]
-                        if progress.status == "confirmed":
-                            card_class = "success"
-                            icon = "✓"
-                            status_text = "Booking Confirmed!"
-                        elif progress.status == "calling":
-                            card_class = "calling"
-                            icon = "●"
-                            status_text = "Calling..."
-                        else:
-                            card_class = "failed"
-                            icon = "×"
-                            status_text = "No availability"
-                    else:
-                        # Center not yet called
-                        card_class = "waiting"
-                        icon = "🏢"
-                        status_text = "Waiting..."
-                    
-                    st.markdown(f'''
-                        <div class="center-card {card_class}">
-                            <div class="center-icon">{icon}</div>
-                            <div class="center-info">
-                                <div class="center-name">{center_name}</div>
-                                <div class="center-status {card_class}">{status_text}</div>
-                            </div>
-                        </div>
-                    ''', unsafe_allow_html=True)
+        if st.session_state.center_final_status:
+            for center, slot in center_slots.items():
+                slot.html(_center_card_html(center, st.session_state.center_final_status.get(center)))
         
         # Retry button if failed
         if st.session_state.auto_booking_complete and (
             not st.session_state.auto_booking_result or 
             st.session_state.auto_booking_result.status != BookingStatus.CONFIRMED
         ):
-            st.markdown("<br>", unsafe_allow_html=True)
+            st.html("<br>")
             col1, col2 = st.columns(2)
             with col1:
-                if st.button("Retry Booking", type="primary", use_container_width=True):
-                    st.session_state.auto_booking_complete = False
-                    st.session_state.calling_centers_progress = []
-                    st.rerun()
+                st.button("Retry Booking", type="primary", use_container_width=True,
+                          on_click=_retry_auto_booking)
             with col2:
-                if st.button("← Back to Dashboard", type="secondary", use_container_width=True):
-                    st.session_state.current_page = "dashboard"
-                    st.session_state.auto_booking_triggered = False
-                    st.session_state.auto_booking_complete = False
-                    st.session_state.show_notification = False
-                    st.rerun()
+                st.button("← Back to Dashboard", type="secondary", use_container_width=True,
+                          on_click=_leave_auto_booking)
     else:
         st.warning("No issue detected. Returning to dashboard...")
         st.session_state.current_page = "dashboard"
         st.rerun()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
 
 
 def render_schedule_service_page():
     """Render the Schedule Service page with automated booking option."""
     
-    st.markdown(
-        """
-        <style>
-        @import url('https://fonts.googleapis.com/css2?family=DM+Sans:wght@400;500;600;700&display=swap');
-        
-        .schedule-header {
-            text-align: center;
-            margin-bottom: 40px;
-        }
-        
-        .schedule-logo {
-            font-family: 'DM Sans', sans-serif;
-            font-size: 28px;
-            font-weight: 700;
-            background: linear-gradient(135deg, #1e3a5f 0%, #3b82f6 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        .booking-mode-card {
-            background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%);
-            border-radius: 16px;
-            padding: 24px;
-            margin: 16px 0;
-            box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.07);
-            border: 2px solid #e2e8f0;
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        
-        .booking-mode-card:hover {
-            border-color: #3b82f6;
-            transform: translateY(-2px);
-            box-shadow: 0 8px 15px -3px rgba(59, 130, 246, 0.15);
-        }
-        
-        .booking-mode-card.selected {
-            border-color: #3b82f6;
-            background: linear-gradient(145deg, #eff6ff 0%, #dbeafe 100%);
-        }
-        
-        .mode-icon {
-            font-size: 32px;
-            margin-bottom: 12px;
-        }
-        
-        .mode-title {
-            font-family: 'DM Sans', sans-serif;
-            font-size: 18px;
-            font-weight: 700;
-            color: #1e293b;
-            margin-bottom: 8px;
-        }
-        
-        .mode-description {
-            font-family: 'DM Sans', sans-serif;
-            font-size: 14px;
-            color: #64748b;
-            line-height: 1.5;
-        }
-        
-        .ai-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 6px;
-            background: linear-gradient(135deg, #8b5cf6 0%, #6366f1 100%);
-            color: white;
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 12px;
-            font-weight: 600;
-            margin-left: 8px;
-        }
-        
-        .call-log-container {
-            background: #1e293b;
-            border-radius: 12px;
-            padding: 16px;
-            margin: 16px 0;
-            max-height: 300px;
-            overflow-y: auto;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 13px;
-        }
-        
-        .call-log-entry {
-            padding: 8px 0;
-            border-bottom: 1px solid #334155;
-        }
-        
-        .call-log-entry:last-child {
-            border-bottom: none;
-        }
-        
-        .call-log-time {
-            color: #64748b;
-            font-size: 11px;
-        }
-        
-        .call-log-status {
-            color: #22c55e;
-        }
-        
-        .call-log-ai {
-            color: #8b5cf6;
-        }
-        
-        .call-log-service {
-            color: #3b82f6;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-    
     st.markdown('''
         <div class="schedule-header">
             <div class="schedule-logo">VehicleCare AI</div>
@@ -1471,22 +1143,16 @@ def render_schedule_service_page():
     ''', unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back"):
-        st.session_state.current_page = "issue_details"
-        st.session_state.auto_booking_status = None
-        st.session_state.auto_booking_logs = []
-        st.rerun()
+    st.button("← Back", on_click=_leave_schedule_service)
     
     st.markdown("### 📅 Schedule Service Appointment")
     
     if st.session_state.current_issue:
         issue = st.session_state.current_issue
-        reading = issue["reading"]
-        issue_title, issue_description, _ = get_issue_details(reading)
-        severity = get_severity_level(reading)
+        issue_title, issue_description, _, severity = _issue_summary(issue)
         
         # Show issue summary
-        st.info(f"**Issue:** {issue_title} | **Severity:** {severity}")
+        st.info(f"Issue: {issue_title} | Severity: {severity}", icon="⚠️")
         
         # Booking mode selection
         st.markdown("#### Choose Booking Method")
@@ -1510,8 +1176,7 @@ def render_schedule_service_page():
         st.markdown("---")
         
         # Service center selection (common to both modes)
-        service_centers = list(SERVICE_CENTER_DIRECTORY.keys())
-        selected_center = st.selectbox("Select Service Center", service_centers)
+        selected_center = st.selectbox("Select Service Center", SERVICE_CENTERS)
         
         # Show service center info
         center_info = SERVICE_CENTER_DIRECTORY.get(selected_center, {})
@@ -1519,26 +1184,8 @@ def render_schedule_service_page():
             st.caption(f"📍 {center_info.get('address', '')} | ⏰ {center_info.get('hours', '')}")
         
         # Service type (auto-fill based on issue)
-        service_types = {
-            "Battery Health Deterioration": "Battery Diagnosis & Replacement",
-            "Battery Failure Critical": "Battery Diagnosis & Replacement",
-            "Coolant System Failure": "Cooling System Inspection & Repair",
-            "Cooling System Failure": "Cooling System Inspection & Repair",
-            "Mechanical Looseness Detected": "Vibration Diagnosis & Repair",
-            "Engine Misfire Detected": "Engine Inspection & Repair",
-            "Throttle System Malfunction": "Throttle System Repair",
-            "Fuel System Malfunction": "Fuel System Inspection & Repair"
-        }
-        
-        service_options = sorted(list(set(service_types.values()))) + ["General Inspection & Diagnosis"]
-        default_service = service_types.get(issue_title, "General Inspection & Diagnosis")
-        
-        try:
-            default_index = service_options.index(default_service)
-        except ValueError:
-            default_index = len(service_options) - 1
-        
-        service_type = st.selectbox("Service Type", service_options, index=default_index)
+        default_index = SERVICE_OPTION_INDEX.get(issue_title, len(SERVICE_OPTIONS) - 1)
+        service_type = st.selectbox("Service Type", SERVICE_OPTIONS, index=default_index)
         
         # Date and time selection
         col1, col2 = st.columns(2)
@@ -1556,14 +1203,17 @@ def render_schedule_service_page():
             selected_time = st.selectbox("Preferred Time", time_slots)
         
         # Customer information
+        # A form, so typing in these fields does not rerun the page until saved
         st.markdown("#### Customer Information")
-        col1, col2 = st.columns(2)
-        with col1:
-            customer_name = st.text_input("Name", value="John Doe")
-            customer_phone = st.text_input("Phone", value="+1 (555) 123-4567")
-        with col2:
-            customer_email = st.text_input("Email", value="john.doe@example.com")
-            vehicle_id = st.text_input("Vehicle ID", value=st.session_state.simulator.vehicle_id)
+        with st.form("customer_form", border=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                customer_name = st.text_input("Name", value="John Doe")
+                customer_phone = st.text_input("Phone", value="+1 (555) 123-4567")
+            with col2:
+                customer_email = st.text_input("Email", value="john.doe@example.com")
+                vehicle_id = st.text_input("Vehicle ID", value=st.session_state.simulator.vehicle_id)
+            st.form_submit_button("Save Details")
         
         st.markdown("---")
         
@@ -1597,108 +1247,97 @@ def render_schedule_service_page():
             
             # Start auto-booking button
             if not st.session_state.booking_in_progress:
-                if st.button("🚀 Start AI Booking Call", type="primary", use_container_width=True):
-                    st.session_state.booking_in_progress = True
-                    st.session_state.auto_booking_logs = []
-                    st.session_state.auto_booking_status = "initiating"
-                    st.rerun()
+                st.button("🚀 Start AI Booking Call", type="primary", use_container_width=True,
+                          on_click=_start_ai_booking_call)
             
             # Show booking progress
             if st.session_state.booking_in_progress:
                 st.markdown("### Call in Progress...")
                 
-                # Progress indicator
-                progress_placeholder = st.empty()
-                status_placeholder = st.empty()
-                log_placeholder = st.empty()
-                
-                # Create booking request
-                booking_request = BookingRequest(
-                    customer_name=customer_name,
-                    customer_phone=customer_phone,
-                    customer_email=customer_email,
-                    vehicle_id=vehicle_id,
-                    issue_type=issue_title,
-                    issue_description=issue_description,
-                    severity=severity,
-                    preferred_date=datetime.combine(selected_date, datetime.min.time()),
-                    preferred_time=selected_time,
-                    service_center_phone=get_service_center_phone(selected_center),
-                    service_center_name=selected_center
-                )
-                
-                # Status callback function
-                def status_callback(status: BookingStatus, message: str):
-                    st.session_state.auto_booking_logs.append({
-                        "time": datetime.now().strftime("%H:%M:%S"),
-                        "status": status.value,
-                        "message": message
-                    })
-                
-                # Run the booking asynchronously
-                async def run_booking():
-                    result = await book_appointment_automatically(
-                        booking_request=booking_request,
-                        google_api_key=os.getenv("GOOGLE_API_KEY", "demo-key"),
-                        azure_speech_key=os.getenv("AZURE_SPEECH_KEY", "demo-key"),
-                        azure_speech_region=os.getenv("AZURE_SPEECH_REGION", "eastus"),
-                        status_callback=status_callback
+                # The call runs on a background thread; this page polls it with
+                # short reruns so the call log keeps updating while it runs
+                job = st.session_state.booking_job
+                if job is None:
+                    # Create booking request
+                    booking_request = BookingRequest(
+                        customer_name=customer_name,
+                        customer_phone=customer_phone,
+                        customer_email=customer_email,
+                        vehicle_id=vehicle_id,
+                        issue_type=issue_title,
+                        issue_description=issue_description,
+                        severity=severity,
+                        preferred_date=datetime.combine(selected_date, datetime.min.time()),
+                        preferred_time=selected_time,
+                        service_center_phone=get_service_center_phone(selected_center),
+                        service_center_name=selected_center
                     )
-                    return result
-                
-                # Execute booking
-                try:
-                    result = asyncio.run(run_booking())
-                    st.session_state.auto_booking_result = result
-                    st.session_state.booking_in_progress = False
                     
-                    if result.status == BookingStatus.CONFIRMED:
-                        # Create appointment from result
-                        appointment = {
-                            "service_center": selected_center,
-                            "service_type": service_type,
-                            "date": selected_date,
-                            "time": result.scheduled_time or selected_time,
-                            "customer_name": customer_name,
-                            "customer_phone": customer_phone,
-                            "customer_email": customer_email,
-                            "issue": issue_title,
-                            "status": "Confirmed (AI Booked)",
-                            "confirmation_number": result.confirmation_number,
-                            "booking_method": "Automated AI Call",
-                            "call_transcript": result.call_transcript,
-                            "created_at": datetime.now()
-                        }
-                        
-                        st.session_state.appointments.append(appointment)
-                        st.session_state.latest_appointment = appointment
+                    updates = queue.Queue()
+                    
+                    # Status callback function (runs on the booking thread,
+                    # so it only queues entries for the script to pick up)
+                    def status_callback(status: BookingStatus, message: str):
+                        updates.put({
+                            "time": datetime.now().strftime("%H:%M:%S"),
+                            "status": status.value,
+                            "message": message
+                        })
+                    
+                    # Run the booking asynchronously
+                    async def run_booking():
+                        result = await book_appointment_automatically(
+                            booking_request=booking_request,
+                            google_api_key=os.getenv("GOOGLE_API_KEY", "demo-key"),
+                            azure_speech_key=os.getenv("AZURE_SPEECH_KEY", "demo-key"),
+                            azure_speech_region=os.getenv("AZURE_SPEECH_REGION", "eastus"),
+                            status_callback=status_callback
+                        )
+                        return result
+                    
+                    job = _start_booking_job(run_booking, updates, booking_request, service_type)
+                    st.session_state.booking_job = job
+                
+                # Move new call-log entries into the session
+                while True:
+                    try:
+                        st.session_state.auto_booking_logs.append(job["updates"].get_nowait())
+                    except queue.Empty:
+                        break
+                
+                if job["thread"].is_alive():
+                    st.info(f"Calling {job['booking_request'].service_center_name}...")
+                    st.fragment(run_every=0.5)(_poll_booking_job)()
+                else:
+                    error = _finish_booking_job(job)
+                    if error is None:
                         st.session_state.current_page = "confirmation"
                         st.rerun()
-                    else:
-                        st.error(f"Booking failed: {result.notes}")
-                        st.session_state.booking_in_progress = False
-                        
-                except Exception as e:
-                    st.error(f"Error during booking: {str(e)}")
-                    st.session_state.booking_in_progress = False
+                    st.error(error)
                 
                 # Display call logs
                 if st.session_state.auto_booking_logs:
                     st.markdown("#### Call Log")
-                    log_html = '<div class="call-log-container">'
-                    for log in st.session_state.auto_booking_logs:
+                    
+                    # Only the most recent entries are put in the DOM
+                    logs = st.session_state.auto_booking_logs
+                    if len(logs) > CALL_LOG_MAX_ENTRIES:
+                        st.caption(f"Showing last {CALL_LOG_MAX_ENTRIES} of {len(logs)} entries")
+                    
+                    log_parts = ['<div class="call-log-container">']
+                    for log in logs[-CALL_LOG_MAX_ENTRIES:]:
                         speaker_class = "call-log-ai" if "AI:" in log["message"] else "call-log-service"
                         if "Service Center:" in log["message"]:
                             speaker_class = "call-log-service"
-                        log_html += f'''
+                        log_parts.append(f'''
                         <div class="call-log-entry">
-                            <span class="call-log-time">[{log["time"]}]</span>
-                            <span class="call-log-status">[{log["status"]}]</span>
-                            <span class="{speaker_class}">{log["message"]}</span>
+                            <span class="call-log-time">[{html_escape(log["time"])}]</span>
+                            <span class="call-log-status">[{html_escape(log["status"])}]</span>
+                            <span class="{speaker_class}">{html_escape(log["message"])}</span>
                         </div>
-                        '''
-                    log_html += '</div>'
-                    st.markdown(log_html, unsafe_allow_html=True)
+                        ''')
+                    log_parts.append('</div>')
+                    st.markdown("".join(log_parts), unsafe_allow_html=True)
         
         # MANUAL BOOKING MODE  
         elif st.session_state.booking_mode == "manual":
@@ -1720,8 +1359,7 @@ def render_schedule_service_page():
                     "created_at": datetime.now()
                 }
                 
-                st.session_state.appointments.append(appointment)
-                st.session_state.latest_appointment = appointment
+                _add_appointment(appointment)
                 st.session_state.current_page = "confirmation"
                 st.rerun()
         
@@ -1740,218 +1378,6 @@ def render_schedule_service_page():
 
 def render_confirmation_page():
     """Render the Appointment Confirmation page with premium dark design."""
-    st.markdown(
-        """
-        <style>
-        .confirm-container {
-            max-width: 700px;
-            margin: 0 auto;
-            padding: 20px;
-        }
-        
-        .confirm-header {
-            text-align: center;
-            margin-bottom: 40px;
-            padding-bottom: 24px;
-            border-bottom: 1px solid #27272a;
-        }
-        
-        .confirm-logo-row {
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 12px;
-            margin-bottom: 24px;
-        }
-        
-        .confirm-logo-icon {
-            width: 48px;
-            height: 48px;
-            background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-            border-radius: 12px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 24px;
-            box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);
-        }
-        
-        .confirm-logo-text {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #fafafa;
-        }
-        
-        .confirm-title {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.75rem;
-            font-weight: 700;
-            color: #fafafa;
-            margin-bottom: 8px;
-        }
-        
-        .confirm-subtitle {
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.95rem;
-        }
-        
-        .success-banner {
-            background: linear-gradient(135deg, rgba(16, 185, 129, 0.2) 0%, rgba(6, 182, 212, 0.15) 100%);
-            border: 1px solid rgba(16, 185, 129, 0.3);
-            padding: 24px;
-            border-radius: 16px;
-            text-align: center;
-            margin-bottom: 28px;
-            box-shadow: 0 0 40px rgba(16, 185, 129, 0.15);
-        }
-        
-        .success-icon {
-            font-size: 56px;
-            margin-bottom: 16px;
-        }
-        
-        .success-text {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.25rem;
-            font-weight: 700;
-            color: #34d399;
-            letter-spacing: 0.02em;
-        }
-        
-        .details-card {
-            background: #1c1c1f;
-            border: 1px solid #27272a;
-            border-radius: 16px;
-            padding: 24px;
-            margin-bottom: 16px;
-            transition: all 0.2s ease;
-        }
-        
-        .details-card:hover {
-            background: #222225;
-            border-color: #3f3f46;
-        }
-        
-        .details-card-header {
-            display: flex;
-            align-items: center;
-            gap: 14px;
-            margin-bottom: 20px;
-            padding-bottom: 16px;
-            border-bottom: 1px solid #27272a;
-        }
-        
-        .details-card-icon {
-            width: 44px;
-            height: 44px;
-            border-radius: 10px;
-            background: rgba(6, 182, 212, 0.15);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 20px;
-        }
-        
-        .details-card-title {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #fafafa;
-        }
-        
-        .details-row {
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            padding: 12px 0;
-            border-bottom: 1px solid #1f1f23;
-        }
-        
-        .details-row:last-child {
-            border-bottom: none;
-        }
-        
-        .details-label {
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.875rem;
-            font-weight: 500;
-        }
-        
-        .details-value {
-            font-family: 'IBM Plex Mono', monospace;
-            color: #fafafa;
-            font-size: 0.9rem;
-            font-weight: 500;
-            text-align: right;
-            max-width: 60%;
-        }
-        
-        .info-banner {
-            background: rgba(245, 158, 11, 0.1);
-            border-left: 3px solid #f59e0b;
-            padding: 16px 20px;
-            border-radius: 0 10px 10px 0;
-            margin-bottom: 28px;
-            display: flex;
-            align-items: center;
-            gap: 14px;
-        }
-        
-        .info-banner-icon {
-            font-size: 24px;
-        }
-        
-        .info-banner-text {
-            font-family: 'Outfit', sans-serif;
-            color: #fbbf24;
-            font-size: 0.9rem;
-            font-weight: 500;
-            line-height: 1.5;
-        }
-        
-        /* Button styling */
-        div[data-testid="stButton"] > button {
-            font-family: 'DM Sans', sans-serif !important;
-            font-weight: 600 !important;
-            font-size: 15px !important;
-            padding: 14px 24px !important;
-            border-radius: 12px !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        div[data-testid="stButton"] > button[kind="secondary"] {
-            background: linear-gradient(145deg, #ffffff 0%, #f8fafc 100%) !important;
-            color: #334155 !important;
-            border: 2px solid #e2e8f0 !important;
-            box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05) !important;
-        }
-        
-        div[data-testid="stButton"] > button[kind="secondary"]:hover {
-            background: #f1f5f9 !important;
-            border-color: #cbd5e1 !important;
-            transform: translateY(-1px) !important;
-        }
-        
-        div[data-testid="stButton"] > button[kind="primary"] {
-            background: linear-gradient(135deg, #1e293b 0%, #334155 100%) !important;
-            color: #ffffff !important;
-            border: none !important;
-            box-shadow: 0 4px 14px rgba(30, 41, 59, 0.25) !important;
-        }
-        
-        div[data-testid="stButton"] > button[kind="primary"]:hover {
-            background: linear-gradient(135deg, #334155 0%, #475569 100%) !important;
-            transform: translateY(-2px) !important;
-            box-shadow: 0 8px 20px rgba(30, 41, 59, 0.3) !important;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-    
     st.markdown('<div class="confirm-container">', unsafe_allow_html=True)
     
     # Header with premium styling
@@ -1978,58 +1404,27 @@ def render_confirmation_page():
         ''', unsafe_allow_html=True)
         
         # Appointment Details Card
-        date_str = appointment["date"].strftime("%A, %B %d, %Y")
+        date_str = appointment["date_long"]
         confirmation_num = appointment.get("confirmation_number", "N/A")
         booking_method = appointment.get("booking_method", "Manual")
         
         # Show AI badge if auto-booked
-        method_badge = ""
-        if booking_method == "Automated AI Call":
-            method_badge = '<span style="background: linear-gradient(135deg, #8b5cf6 0%, #6366f1 100%); color: white; padding: 4px 12px; border-radius: 20px; font-size: 12px; font-weight: 600; margin-left: 8px;">AI Booked</span>'
-        
-        st.markdown(f'''
-            <div class="details-card">
-                <div class="details-card-header">
-                    <div class="details-card-icon" style="font-weight: 600; color: #22d3ee;">≡</div>
-                    <div class="details-card-title">Appointment Details {method_badge}</div>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Confirmation #</span>
-                    <span class="details-value">{confirmation_num}</span>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Service Center</span>
-                    <span class="details-value">{appointment["service_center"]}</span>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Service Type</span>
-                    <span class="details-value">{appointment["service_type"]}</span>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Date</span>
-                    <span class="details-value">{date_str}</span>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Time</span>
-                    <span class="details-value">{appointment["time"]}</span>
-                </div>
-                <div class="details-row">
-                    <span class="details-label">Booking Method</span>
-                    <span class="details-value">{booking_method}</span>
-                </div>
-            </div>
-        ''', unsafe_allow_html=True)
+        method_badge = AI_BOOKED_BADGE_HTML if booking_method == "Automated AI Call" else ""
+        
+        st.markdown(APPOINTMENT_DETAILS_TPL.format(
+            badge=method_badge,
+            confirmation_number=html_escape(str(confirmation_num)),
+            service_center=html_escape(appointment["service_center"]),
+            service_type=html_escape(appointment["service_type"]),
+            date=date_str,
+            time=html_escape(appointment["time"]),
+            booking_method=html_escape(booking_method),
+        ), unsafe_allow_html=True)
         
         # Show call transcript if available (for AI bookings)
         if appointment.get("call_transcript"):
             with st.expander("View Call Transcript"):
-                st.markdown(f'''
-                    <div style="background: #1e293b; color: #e2e8f0; padding: 16px; 
-                                border-radius: 8px; font-family: monospace; font-size: 13px;
-                                white-space: pre-wrap; max-height: 400px; overflow-y: auto;">
-{appointment["call_transcript"]}
-                    </div>
-                ''', unsafe_allow_html=True)
+                st.code(appointment["call_transcript"], language=None)
         
         # Info Banner
         st.markdown('''
@@ -2057,146 +1452,6 @@ def render_confirmation_page():
 
 def render_vehicle_health_dashboard():
     """Render the Vehicle Health Dashboard with premium dark design."""
-    st.markdown(
-        """
-        <style>
-        .health-container {
-            max-width: 900px;
-            margin: 0 auto;
-        }
-        
-        .health-header {
-            display: flex;
-            align-items: center;
-            gap: 16px;
-            padding-bottom: 24px;
-            margin-bottom: 32px;
-            border-bottom: 1px solid #27272a;
-        }
-        
-        .health-logo {
-            width: 56px;
-            height: 56px;
-            background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%);
-            border-radius: 14px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 28px;
-            box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);
-        }
-        
-        .health-header-text h1 {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.75rem;
-            font-weight: 700;
-            color: #fafafa;
-            margin: 0;
-        }
-        
-        .health-header-text p {
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.9rem;
-            color: #71717a;
-            margin: 4px 0 0 0;
-        }
-        
-        .health-box {
-            background: #1c1c1f;
-            border: 1px solid #27272a;
-            border-radius: 16px;
-            padding: 24px;
-            margin: 16px 0;
-            transition: all 0.2s ease;
-        }
-        
-        .health-box:hover {
-            background: #222225;
-            border-color: #3f3f46;
-        }
-        
-        .health-title {
-            font-family: 'Outfit', sans-serif;
-            font-size: 1.1rem;
-            font-weight: 600;
-            color: #fafafa;
-            margin-bottom: 16px;
-            padding-bottom: 12px;
-            border-bottom: 1px solid #27272a;
-        }
-        
-        .health-detail {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px 0;
-            border-bottom: 1px solid #1f1f23;
-        }
-        
-        .health-detail:last-child {
-            border-bottom: none;
-        }
-        
-        .health-label {
-            font-family: 'Outfit', sans-serif;
-            color: #71717a;
-            font-size: 0.875rem;
-        }
-        
-        .health-value {
-            font-family: 'IBM Plex Mono', monospace;
-            font-weight: 600;
-            color: #fafafa;
-            font-size: 0.9rem;
-        }
-        
-        .health-score-container {
-            text-align: center;
-            padding: 32px;
-        }
-        
-        .health-score-ring {
-            width: 160px;
-            height: 160px;
-            border-radius: 50%;
-            background: conic-gradient(#10b981 var(--score-pct), #27272a 0);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin: 0 auto 16px;
-            position: relative;
-        }
-        
-        .health-score-inner {
-            width: 130px;
-            height: 130px;
-            border-radius: 50%;
-            background: #1c1c1f;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-        }
-        
-        .health-score-value {
-            font-family: 'IBM Plex Mono', monospace;
-            font-size: 2.5rem;
-            font-weight: 700;
-            color: #10b981;
-        }
-        
-        .health-score-label {
-            font-family: 'Outfit', sans-serif;
-            font-size: 0.8rem;
-            color: #71717a;
-            text-transform: uppercase;
-            letter-spacing: 0.05em;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-    
     # Back button
     if st.button("← Back to Dashboard"):
         st.session_state.current_page = "dashboard"
@@ -2222,54 +1477,29 @@ def render_vehicle_health_dashboard():
         latest = None
     
     if latest:
-        # Calculate health metrics
-        health_score = calculate_health_score(latest)
-        predicted_issue = get_predicted_issue(latest)
-        risk_level = get_risk_level(latest)
-        
-        # Vehicle Health Dashboard box
-        st.markdown('<div class="health-box">', unsafe_allow_html=True)
-        st.markdown('<div class="health-title">Vehicle Health Dashboard</div>', unsafe_allow_html=True)
-        
-        # Vehicle ID
+        # Calculate health metrics once per reading; the page shows the same
+        # reading on every rerun until a new one arrives
+        if "health_summary" not in latest:
+            latest["health_summary"] = get_health_summary(latest)
+        health_score, predicted_issue, risk_level = latest["health_summary"]
+        
+        # Vehicle Health Dashboard box, emitted as one element so the rows
+        # actually sit inside the box
         vehicle_id = latest.get("vehicle_id", "VIN: 1FA6P00000005721")
-        st.markdown(
-            f'<div class="health-detail">'
-            f'<span class="health-label">Vehicle ID:</span>'
-            f'<span class="health-value">{vehicle_id}</span>'
-            f'</div>',
-            unsafe_allow_html=True
-        )
-        
-        # Health Score
-        st.markdown(
-            f'<div class="health-detail">'
-            f'<span class="health-label">Health Score:</span>'
-            f'<span class="health-value">{health_score}%</span>'
-            f'</div>',
-            unsafe_allow_html=True
-        )
-        
-        # Predicted Issue
-        st.markdown(
-            f'<div class="health-detail">'
-            f'<span class="health-label">Predicted Issue:</span>'
-            f'<span class="health-value">{predicted_issue}</span>'
-            f'</div>',
-            unsafe_allow_html=True
+        rows = (
+            ("Vehicle ID:", html_escape(vehicle_id)),
+            ("Health Score:", f"{health_score}%"),
+            ("Predicted Issue:", html_escape(predicted_issue)),
+            ("Risk Level:", html_escape(risk_level)),
         )
-        
-        # Risk Level
         st.markdown(
-            f'<div class="health-detail">'
-            f'<span class="health-label">Risk Level:</span>'
-            f'<span class="health-value">{risk_level}</span>'
-            f'</div>',
+            '<div class="data-card health-box">'
+            '<div class="data-card-title health-title">Vehicle Health Dashboard</div>'
+            + "".join(HEALTH_DETAIL_TPL.format(label=label, value=value) for label, value in rows)
+            + '</div>',
             unsafe_allow_html=True
         )
         
-        st.markdown('</div>', unsafe_allow_html=True)
-        
         # View Details button
         if st.button("View Details", type="primary", use_container_width=True):
             # Check if there's a current issue to view
@@ -2296,76 +1526,51 @@ def render_appointments_page():
     st.markdown("### My Appointments")
     
     if st.session_state.appointments:
-        for idx, appointment in enumerate(reversed(st.session_state.appointments)):
-            with st.expander(f"Appointment {len(st.session_state.appointments) - idx} - {appointment['date'].strftime('%B %d, %Y')}"):
-                st.markdown(f"**Status:** {appointment['status']}")
-                st.markdown(f"**Service Center:** {appointment['service_center']}")
-                st.markdown(f"**Service Type:** {appointment['service_type']}")
-                st.markdown(f"**Date:** {appointment['date'].strftime('%A, %B %d, %Y')}")
-                st.markdown(f"**Time:** {appointment['time']}")
-                st.markdown(f"**Issue:** {appointment['issue']}")
-                st.markdown(f"**Customer:** {appointment['customer_name']}")
-                st.markdown(f"**Phone:** {appointment['customer_phone']}")
-                st.markdown(f"**Email:** {appointment['customer_email']}")
+        # Newest first, one page at a time
+        total = len(st.session_state.appointments)
+        shown = min(total, APPOINTMENTS_PAGE_SIZE * st.session_state.appointments_page)
+        appointments = st.session_state.appointments
+        for idx in range(total - 1, total - shown - 1, -1):
+            appointment = appointments[idx]
+            with st.expander(f"Appointment {idx + 1} - {appointment['date_short']}"):
+                # One markdown element per appointment rather than one per field
+                st.markdown("\n\n".join([
+                    f"**Status:** {appointment['status']}",
+                    f"**Service Center:** {appointment['service_center']}",
+                    f"**Service Type:** {appointment['service_type']}",
+                    f"**Date:** {appointment['date_long']}",
+                    f"**Time:** {appointment['time']}",
+                    f"**Issue:** {appointment['issue']}",
+                    f"**Customer:** {appointment['customer_name']}",
+                    f"**Phone:** {appointment['customer_phone']}",
+                    f"**Email:** {appointment['customer_email']}",
+                ]))
+        
+        if shown < total:
+            st.caption(f"Showing {shown} of {total} appointments")
+            st.button("Load more", on_click=_load_more_appointments)
     else:
         st.info("No appointments scheduled yet.")
 
 # Sidebar with Premium Styling
 with st.sidebar:
-    # Premium Logo Header
-    st.markdown('''
-        <div style="display: flex; align-items: center; gap: 12px; padding: 8px 0 20px 0; margin-bottom: 8px; border-bottom: 1px solid #27272a;">
-            <div style="width: 40px; height: 40px; background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%); border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 14px; font-weight: 700; color: white; box-shadow: 0 4px 12px rgba(16, 185, 129, 0.3);">VC</div>
-            <div>
-                <div style="font-family: \'Outfit\', sans-serif; font-size: 1.2rem; font-weight: 700; color: #fafafa; letter-spacing: -0.02em;">VehicleCare</div>
-                <div style="font-family: \'Outfit\', sans-serif; font-size: 0.7rem; color: #71717a; text-transform: uppercase; letter-spacing: 0.1em;">AI • Predictive</div>
-            </div>
-        </div>
-    ''', unsafe_allow_html=True)
-    
-    st.markdown('''
-        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; color: #71717a; margin: 16px 0 8px 0;">Vehicle Control</div>
-    ''', unsafe_allow_html=True)
+    # Premium Logo Header and the first section title, as one element
+    st.markdown(SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
     vehicle_id = st.text_input("Vehicle ID", value="HERO-MNM-01", label_visibility="collapsed", placeholder="Enter Vehicle ID")
     st.session_state.simulator.vehicle_id = vehicle_id
     
-    st.markdown('''
-        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; color: #71717a; margin: 24px 0 8px 0;">Fault Simulation</div>
-    ''', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_SECTION_HTML["fault"], unsafe_allow_html=True)
     fault_type = st.selectbox(
         "Simulate Component Failure",
-        ["None", "Overheat", "Vibration", "Battery Failure", 
-         "Throttle Malfunction", "Engine Misfire", 
-         "Fuel System Issue", "Cooling System Failure"],
+        FAULT_LABELS,
         index=0,
         label_visibility="collapsed"
     )
     
     # Fault status indicator
-    fault_active = False
-    if fault_type == "Overheat":
-        st.session_state.simulator.inject_fault("overheat")
-        fault_active = True
-    elif fault_type == "Vibration":
-        st.session_state.simulator.inject_fault("vibration")
-        fault_active = True
-    elif fault_type == "Battery Failure":
-        st.session_state.simulator.inject_fault("battery_failure")
-        fault_active = True
-    elif fault_type == "Throttle Malfunction":
-        st.session_state.simulator.inject_fault("throttle_malfunction")
-        fault_active = True
-    elif fault_type == "Engine Misfire":
-        st.session_state.simulator.inject_fault("engine_misfire")
-        fault_active = True
-    elif fault_type == "Fuel System Issue":
-        st.session_state.simulator.inject_fault("fuel_system")
-        fault_active = True
-    elif fault_type == "Cooling System Failure":
-        st.session_state.simulator.inject_fault("cooling_system")
-        fault_active = True
-    else:
-        st.session_state.simulator.inject_fault(None)
+    fault_key = FAULT_TYPES.get(fault_type)
+    st.session_state.simulator.inject_fault(fault_key)
+    fault_active = fault_key is not None
     
     # Premium fault status indicator
     if fault_active:
@@ -2383,95 +1588,37 @@ with st.sidebar:
             </div>
         ''', unsafe_allow_html=True)
     
-    st.markdown('''
-        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; color: #71717a; margin: 24px 0 8px 0;">Dashboard Controls</div>
-    ''', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_SECTION_HTML["controls"], unsafe_allow_html=True)
     auto_update = st.checkbox("Auto Update", value=st.session_state.auto_update)
     st.session_state.auto_update = auto_update
     
     # Update interval dropdown
-    interval_options = {
-        "1 second": 1,
-        "2 seconds": 2,
-        "5 seconds": 5,
-        "10 seconds": 10,
-        "30 seconds": 30,
-        "1 minute": 60,
-        "2 minutes": 120,
-        "5 minutes": 300
-    }
-    
-    # Find the index of current interval
-    interval_list = list(interval_options.items())
-    current_index = 0
-    for idx, (label, seconds) in enumerate(interval_list):
-        if seconds == st.session_state.update_interval:
-            current_index = idx
-            break
-    
     selected_interval = st.selectbox(
         "Update Interval",
-        options=list(interval_options.keys()),
-        index=current_index
+        options=INTERVAL_LABELS,
+        index=INTERVAL_INDEX.get(st.session_state.update_interval, 0)
     )
-    st.session_state.update_interval = interval_options[selected_interval]
+    st.session_state.update_interval = INTERVAL_OPTIONS[selected_interval]
     
-    if st.button("Generate New Reading"):
-        # Sync detector history before detection (if method exists)
-        if hasattr(st.session_state.detector, 'sync_history'):
-            st.session_state.detector.sync_history(st.session_state.readings_history)
-        
-        reading = st.session_state.simulator.generate_reading()
-        anomaly = st.session_state.detector.detect_anomaly(reading)
-        score = st.session_state.detector.get_anomaly_score(reading)
-        
-        reading["anomaly"] = anomaly
-        reading["anomaly_score"] = score
-        st.session_state.readings_history.append(reading)
-        
-        if anomaly == -1:
-            recommendation = analyze_anomaly(reading)
-            anomaly_data = {
-                "timestamp": reading["timestamp"],
-                "reading": reading,
-                "recommendation": recommendation
-            }
-            st.session_state.anomalies_detected.append(anomaly_data)
-            
-            # Set current issue and show notification
-            st.session_state.current_issue = anomaly_data
-            st.session_state.show_notification = True
+    # Runs as a callback so an anomaly opens auto-booking before this run renders
+    st.button("Generate New Reading", on_click=_generate_reading)
     
     if st.button("Clear History", use_container_width=True):
-        st.session_state.readings_history = []
+        st.session_state.readings_history = deque(maxlen=HISTORY_LENGTH)
+        st.session_state.history_buffers = _new_history_buffers()
         st.session_state.anomalies_detected = []
         st.rerun()
     
-    # Status Section with premium styling
-    st.markdown('''
-        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; color: #71717a; margin: 24px 0 12px 0;">System Status</div>
-    ''', unsafe_allow_html=True)
-    
-    readings_count = len(st.session_state.readings_history)
-    anomalies_count = len(st.session_state.anomalies_detected)
-    
-    st.markdown(f'''
-        <div style="display: grid; gap: 8px;">
-            <div style="display: flex; justify-content: space-between; align-items: center; padding: 10px 12px; background: #1c1c1f; border: 1px solid #27272a; border-radius: 8px;">
-                <span style="font-family: \'Outfit\', sans-serif; font-size: 0.8rem; color: #a1a1aa;">Readings</span>
-                <span style="font-family: \'IBM Plex Mono\', monospace; font-size: 0.9rem; color: #fafafa; font-weight: 600;">{readings_count}</span>
-            </div>
-            <div style="display: flex; justify-content: space-between; align-items: center; padding: 10px 12px; background: #1c1c1f; border: 1px solid {'rgba(239, 68, 68, 0.3)' if anomalies_count > 0 else '#27272a'}; border-radius: 8px;">
-                <span style="font-family: \'Outfit\', sans-serif; font-size: 0.8rem; color: #a1a1aa;">Anomalies</span>
-                <span style="font-family: \'IBM Plex Mono\', monospace; font-size: 0.9rem; color: {'#f87171' if anomalies_count > 0 else '#fafafa'}; font-weight: 600;">{anomalies_count}</span>
-            </div>
-        </div>
-    ''', unsafe_allow_html=True)
+    # Status Section with premium styling (title included in the cached HTML).
+    # Auto-update ticks only rerun the telemetry fragment, so with auto-update
+    # on the counters refresh as a fragment of their own.
+    if st.session_state.auto_update:
+        st.fragment(run_every=STATUS_REFRESH_INTERVAL)(_render_sidebar_status)()
+    else:
+        _render_sidebar_status()
     
     # Quick Access
-    st.markdown('''
-        <div style="font-family: \'Outfit\', sans-serif; font-size: 0.75rem; font-weight: 600; text-transform: uppercase; letter-spacing: 0.08em; color: #71717a; margin: 24px 0 12px 0;">Quick Access</div>
-    ''', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_SECTION_HTML["quick_access"], unsafe_allow_html=True)
     
     if st.button("Health Dashboard", use_container_width=True):
         st.session_state.current_page = "health_dashboard"
@@ -2483,365 +1630,214 @@ with st.sidebar:
             st.rerun()
 
 # Main dashboard - Page routing
-# Check if there's a notification to show - AUTO-BOOKING ON ANOMALY DETECTION
+# An anomaly raised away from the dashboard opens auto-booking on return;
+# routing below then renders that page in this same run
 if st.session_state.show_notification and st.session_state.current_page == "dashboard":
-    # Auto-navigate directly to auto-booking progress when anomaly detected
-    st.session_state.auto_booking_triggered = False  # Reset for new booking
-    st.session_state.auto_booking_complete = False
-    st.session_state.calling_centers_progress = []
-    st.session_state.current_page = "auto_booking_progress"
-    st.rerun()
+    _open_auto_booking()
 
-# Route to appropriate page
-if st.session_state.current_page == "issue_details":
-    render_issue_details_page()
-    st.stop()
-elif st.session_state.current_page == "auto_booking_progress":
-    render_auto_booking_progress_page()
-    st.stop()
-elif st.session_state.current_page == "schedule_service":
-    render_schedule_service_page()
-    st.stop()
-elif st.session_state.current_page == "confirmation":
-    render_confirmation_page()
-    st.stop()
-elif st.session_state.current_page == "health_dashboard":
-    render_vehicle_health_dashboard()
-    st.stop()
-elif st.session_state.current_page == "appointments":
-    render_appointments_page()
+# A booking call left running when the user navigated away from the Schedule
+# Service page is collected once it finishes, so its appointment is not lost
+if (st.session_state.booking_job is not None and
+        st.session_state.current_page != "schedule_service" and
+        not st.session_state.booking_job["thread"].is_alive()):
+    _finish_booking_job(st.session_state.booking_job)
+
+# Route to appropriate page (anything else shows the dashboard below)
+PAGE_RENDERERS = MappingProxyType({
+    "issue_details": render_issue_details_page,
+    "auto_booking_progress": render_auto_booking_progress_page,
+    "schedule_service": render_schedule_service_page,
+    "confirmation": render_confirmation_page,
+    "health_dashboard": render_vehicle_health_dashboard,
+    "appointments": render_appointments_page
+})
+
+render_page = PAGE_RENDERERS.get(st.session_state.current_page)
+if render_page is not None:
+    render_page()
     st.stop()
 
 # Default: Full dashboard with premium header
-st.markdown('''
-    <div style="display: flex; align-items: center; justify-content: space-between; padding: 0 0 24px 0; margin-bottom: 24px; border-bottom: 1px solid #27272a;">
-        <div style="display: flex; align-items: center; gap: 16px;">
-            <div style="width: 56px; height: 56px; background: linear-gradient(135deg, #10b981 0%, #06b6d4 100%); border-radius: 14px; display: flex; align-items: center; justify-content: center; font-size: 18px; font-weight: 700; color: white; box-shadow: 0 8px 24px rgba(16, 185, 129, 0.3);">VC</div>
-            <div>
-                <h1 style="font-family: \'Outfit\', sans-serif; font-size: 1.75rem; font-weight: 700; color: #fafafa; margin: 0; letter-spacing: -0.02em;">Predictive Maintenance</h1>
-                <p style="font-family: \'Outfit\', sans-serif; font-size: 0.9rem; color: #71717a; margin: 4px 0 0 0;">Real-time vehicle telemetry monitoring and AI anomaly detection</p>
-            </div>
-        </div>
-        <div style="display: flex; align-items: center; gap: 8px; background: rgba(16, 185, 129, 0.1); border: 1px solid rgba(16, 185, 129, 0.2); padding: 8px 16px; border-radius: 24px;">
-            <span style="width: 8px; height: 8px; border-radius: 50%; background: #10b981; animation: pulse 2s ease-in-out infinite;"></span>
-            <span style="font-family: \'Outfit\', sans-serif; font-size: 0.8rem; color: #34d399; font-weight: 500;">Live Monitoring</span>
-        </div>
-    </div>
-''', unsafe_allow_html=True)
+st.markdown(MAIN_HEADER_HTML, unsafe_allow_html=True)
 
-# Auto-update logic - Generate new data based on interval
-if st.session_state.auto_update:
-    current_time = time.time()
-    
-    # Initialize last_update_time if not set
-    if "last_update_time" not in st.session_state:
-        st.session_state.last_update_time = current_time
-    
-    time_since_last_update = current_time - st.session_state.last_update_time
-    
-    # Check if it's time to generate new data
-    if time_since_last_update >= st.session_state.update_interval:
-        # Sync detector history with session state history before detection
-        if hasattr(st.session_state.detector, 'sync_history'):
-            st.session_state.detector.sync_history(st.session_state.readings_history)
-        
-        # Generate new reading
-        reading = st.session_state.simulator.generate_reading()
-        anomaly = st.session_state.detector.detect_anomaly(reading)
-        score = st.session_state.detector.get_anomaly_score(reading)
-        
-        reading["anomaly"] = anomaly
-        reading["anomaly_score"] = score
-        
-        # Update latest reading for display
-        st.session_state.latest_reading = reading
-        
-        # Add to history
-        st.session_state.readings_history.append(reading)
-        
-        if anomaly == -1:
-            recommendation = analyze_anomaly(reading)
-            anomaly_data = {
-                "timestamp": reading["timestamp"],
-                "reading": reading,
-                "recommendation": recommendation
-            }
-            st.session_state.anomalies_detected.append(anomaly_data)
-            
-            # Set current issue and show notification
-            st.session_state.current_issue = anomaly_data
-            st.session_state.show_notification = True
-        
-        # Keep only last 100 readings for performance
-        if len(st.session_state.readings_history) > 100:
-            st.session_state.readings_history = st.session_state.readings_history[-100:]
-        
-        st.session_state.last_update_time = current_time
-        
-        # Sync detector history after adding
-        if hasattr(st.session_state.detector, 'sync_history'):
-            st.session_state.detector.sync_history(st.session_state.readings_history)
-    
-    # Calculate time until next update
-    time_until_next = max(0, st.session_state.update_interval - time_since_last_update)
-    
-    # Show refresh status
+def _render_update_status():
+    """Show the auto-update interval, the countdown to the next update and the reading count."""
+    elapsed = time.monotonic() - st.session_state.last_update_time
+    time_until_next = max(0, st.session_state.update_interval - elapsed)
     st.info(f"Auto-updating every {st.session_state.update_interval}s | Next update in {int(time_until_next)}s | Total readings: {len(st.session_state.readings_history)}")
 
-# Display latest anomaly alert with notification banner (compact)
-if st.session_state.anomalies_detected:
-    latest_anomaly = st.session_state.anomalies_detected[-1]
-    
-    # Show compact notification banner only
-    st.markdown("---")
-    col1, col2 = st.columns([4, 1])
-    with col1:
-        st.error("🚨 **ANOMALY DETECTED** - Vehicle issue identified by predictive analysis")
-    with col2:
-        if st.button("View Details", type="primary"):
-            st.session_state.current_issue = latest_anomaly
-            st.session_state.current_page = "issue_details"
-            st.rerun()
-    st.markdown("---")
-
-# Current reading display
-# Use latest reading if available (from auto-update), otherwise use last from history
-if "latest_reading" in st.session_state:
-    latest = st.session_state.latest_reading
-elif st.session_state.readings_history:
-    latest = st.session_state.readings_history[-1]
-else:
-    latest = None
 
-if latest:
-    
-    # Metrics row
-    col1, col2, col3, col4, col5 = st.columns(5)
-    
-    with col1:
-        st.metric(
-            "Engine RPM",
-            f"{latest['sensors']['engine_rpm']:.0f}",
-            delta=None
-        )
-    
-    with col2:
-        temp_status = "CRITICAL" if latest['sensors']['engine_temp_c'] > 120 else "NORMAL"
-        st.metric(
-            "Engine Temp",
-            f"{latest['sensors']['engine_temp_c']:.1f}°C",
-            delta=None
-        )
-        st.caption(temp_status)
-    
-    with col3:
-        vib_status = "CRITICAL" if latest['sensors']['vibration_level_g'] > 1.0 else "NORMAL"
-        st.metric(
-            "Vibration",
-            f"{latest['sensors']['vibration_level_g']:.3f}g",
-            delta=None
-        )
-        st.caption(vib_status)
+def _render_telemetry():
+    """
+    Render the live telemetry: the auto-update step, alert, metrics and chart.
+    
+    With auto-update on this runs as a fragment on the update interval, so
+    each tick reruns only this part of the dashboard rather than the whole app.
+    """
+    # Auto-update logic - Generate new data based on interval
+    if st.session_state.auto_update:
+        # Monotonic, so wall-clock adjustments never skip or repeat an update
+        current_time = time.monotonic()
+        
+        # Start the update clock on first use
+        if st.session_state.last_update_time == 0.0:
+            st.session_state.last_update_time = current_time
+        
+        time_since_last_update = current_time - st.session_state.last_update_time
+        
+        # Check if it's time to generate new data
+        if time_since_last_update >= st.session_state.update_interval - AUTO_UPDATE_SLACK:
+            # Sync detector history with session state history before detection
+            if hasattr(st.session_state.detector, 'sync_history'):
+                st.session_state.detector.sync_history(st.session_state.readings_history)
+            
+            # Generate new reading
+            reading = st.session_state.simulator.generate_reading()
+            anomaly, score = st.session_state.detector.detect_and_score(reading)
+            
+            reading["anomaly"] = anomaly
+            reading["anomaly_score"] = score
+            
+            # Update latest reading for display
+            st.session_state.latest_reading = reading
+            
+            # Add to history
+            _record_reading(reading)
+            
+            st.session_state.last_update_time = current_time
+            
+            if anomaly == -1:
+                _report_anomaly(reading)
+                # A full run is needed to leave the dashboard for auto-booking
+                if st.session_state.current_page != "dashboard":
+                    st.rerun()
+            
+            # Sync detector history after adding
+            if hasattr(st.session_state.detector, 'sync_history'):
+                st.session_state.detector.sync_history(st.session_state.readings_history)
+        
+        # Show refresh status, counting down every second between ticks
+        st.fragment(run_every=STATUS_REFRESH_INTERVAL)(_render_update_status)()
     
-    with col4:
-        st.metric(
-            "Throttle",
-            f"{latest['sensors']['throttle_pos_pct']}%",
-            delta=None
-        )
+    # Display latest anomaly alert with notification banner (compact)
+    if st.session_state.anomalies_detected:
+        latest_anomaly = st.session_state.anomalies_detected[-1]
+        
+        # Show compact notification banner only
+        st.markdown("---")
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.error("🚨 **ANOMALY DETECTED** - Vehicle issue identified by predictive analysis")
+        with col2:
+            if st.button("View Details", type="primary"):
+                st.session_state.current_issue = latest_anomaly
+                st.session_state.current_page = "issue_details"
+                st.rerun()
+        st.markdown("---")
     
-    with col5:
-        st.metric(
-            "Battery",
-            f"{latest['sensors']['battery_voltage_v']:.2f}V",
-            delta=None
-        )
+    # Current reading display
+    # Use latest reading if available (from auto-update), otherwise use last from history
+    if "latest_reading" in st.session_state:
+        latest = st.session_state.latest_reading
+    elif st.session_state.readings_history:
+        latest = st.session_state.readings_history[-1]
+    else:
+        latest = None
     
-    # Anomaly status
-    anomaly_status = "ANOMALY DETECTED" if latest['anomaly'] == -1 else "NORMAL"
-    st.markdown(f"**Status:** {anomaly_status} | **Anomaly Score:** {latest['anomaly_score']:.3f}")
-    
-    st.markdown("---")
-    
-    # Charts
-    if len(st.session_state.readings_history) > 1:
-        df = pd.DataFrame([
-            {
-                "timestamp": r["timestamp"],
-                "engine_rpm": r["sensors"]["engine_rpm"],
-                "engine_temp_c": r["sensors"]["engine_temp_c"],
-                "vibration_level_g": r["sensors"]["vibration_level_g"],
-                "throttle_pos_pct": r["sensors"]["throttle_pos_pct"],
-                "battery_voltage_v": r["sensors"]["battery_voltage_v"],
-                "anomaly": r["anomaly"],
-                "anomaly_score": r["anomaly_score"]
-            }
-            for r in st.session_state.readings_history
-        ])
-        
-        # Convert timestamp to datetime for plotting
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        
-        # Create subplots with better spacing
-        fig = make_subplots(
-            rows=3, cols=2,
-            subplot_titles=("Engine RPM", "Engine Temperature", "Vibration Level", "Throttle Position", "Battery Voltage", "Anomaly Score"),
-            vertical_spacing=0.15,
-            horizontal_spacing=0.12,
-            row_heights=[0.33, 0.33, 0.34]
-        )
-        
-        # Engine RPM
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["engine_rpm"],
-                mode="lines+markers",
-                name="RPM",
-                line=dict(color="blue", width=2)
-            ),
-            row=1, col=1
-        )
-        fig.add_hline(y=3000, line_dash="dash", line_color="orange", row=1, col=1, annotation_text="Max Normal")
-        
-        # Engine Temperature
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["engine_temp_c"],
-                mode="lines+markers",
-                name="Temp (°C)",
-                line=dict(color="red", width=2)
-            ),
-            row=1, col=2
-        )
-        fig.add_hline(y=105, line_dash="dash", line_color="orange", row=1, col=2, annotation_text="Max Normal")
-        fig.add_hline(y=120, line_dash="dash", line_color="red", row=1, col=2, annotation_text="Critical")
-        
-        # Vibration
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["vibration_level_g"],
-                mode="lines+markers",
-                name="Vibration (g)",
-                line=dict(color="purple", width=2)
-            ),
-            row=2, col=1
-        )
-        fig.add_hline(y=0.4, line_dash="dash", line_color="orange", row=2, col=1, annotation_text="Max Normal")
-        fig.add_hline(y=1.0, line_dash="dash", line_color="red", row=2, col=1, annotation_text="Critical")
-        
-        # Throttle
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["throttle_pos_pct"],
-                mode="lines+markers",
-                name="Throttle (%)",
-                line=dict(color="green", width=2)
-            ),
-            row=2, col=2
-        )
-        
-        # Battery Voltage
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["battery_voltage_v"],
-                mode="lines+markers",
-                name="Battery (V)",
-                line=dict(color="orange", width=2)
-            ),
-            row=3, col=1
-        )
-        fig.add_hline(y=13.5, line_dash="dash", line_color="green", row=3, col=1, annotation_text="Min Normal")
-        fig.add_hline(y=14.5, line_dash="dash", line_color="green", row=3, col=1, annotation_text="Max Normal")
-        
-        # Anomaly Score (color-coded by anomaly status)
-        colors = ["red" if a == -1 else "green" for a in df["anomaly"]]
-        fig.add_trace(
-            go.Scatter(
-                x=df["timestamp"],
-                y=df["anomaly_score"],
-                mode="lines+markers",
-                name="Anomaly Score",
-                line=dict(color="gray", width=2),
-                marker=dict(color=colors, size=8)
-            ),
-            row=3, col=2
-        )
-        fig.add_hline(y=0, line_dash="dash", line_color="red", row=3, col=2, annotation_text="Anomaly Threshold")
-        
-        # Update layout with dark theme styling
-        fig.update_layout(
-            height=1000,
-            showlegend=False,
-            title_text="Vehicle Telemetry Dashboard",
-            title_x=0.5,
-            margin=dict(l=50, r=50, t=80, b=50),
-            paper_bgcolor='rgba(28, 28, 31, 1)',
-            plot_bgcolor='rgba(24, 24, 27, 1)',
-            font=dict(color='#a1a1aa', family='Outfit, sans-serif'),
-            title_font=dict(color='#fafafa', size=18, family='Outfit, sans-serif')
-        )
+    if latest:
         
-        # Update axes for dark theme
-        fig.update_xaxes(
-            gridcolor='#27272a',
-            linecolor='#3f3f46',
-            tickfont=dict(color='#71717a'),
-            title_font=dict(color='#a1a1aa')
-        )
-        fig.update_yaxes(
-            gridcolor='#27272a',
-            linecolor='#3f3f46',
-            tickfont=dict(color='#71717a'),
-            title_font=dict(color='#a1a1aa')
-        )
+        # Metrics row
+        col1, col2, col3, col4, col5 = st.columns(5)
         
-        # Update x-axis labels
-        for i in range(1, 4):
-            for j in range(1, 3):
-                fig.update_xaxes(title_text="Time", row=i, col=j)
+        with col1:
+            st.metric(
+                "Engine RPM",
+                f"{latest['sensors']['engine_rpm']:.0f}",
+                delta=None
+            )
         
-        # Update y-axis labels
-        fig.update_yaxes(title_text="RPM", row=1, col=1)
-        fig.update_yaxes(title_text="°C", row=1, col=2)
-        fig.update_yaxes(title_text="g", row=2, col=1)
-        fig.update_yaxes(title_text="%", row=2, col=2)
-        fig.update_yaxes(title_text="V", row=3, col=1)
-        fig.update_yaxes(title_text="Score", row=3, col=2)
+        with col2:
+            temp_status = "CRITICAL" if latest['sensors']['engine_temp_c'] > 120 else "NORMAL"
+            st.metric(
+                "Engine Temp",
+                f"{latest['sensors']['engine_temp_c']:.1f}°C",
+                delta=None
+            )
+            st.caption(temp_status)
+        
+        with col3:
+            vib_status = "CRITICAL" if latest['sensors']['vibration_level_g'] > 1.0 else "NORMAL"
+            st.metric(
+                "Vibration",
+                f"{latest['sensors']['vibration_level_g']:.3f}g",
+                delta=None
+            )
+            st.caption(vib_status)
+        
+        with col4:
+            st.metric(
+                "Throttle",
+                f"{latest['sensors']['throttle_pos_pct']}%",
+                delta=None
+            )
+        
+        with col5:
+            st.metric(
+                "Battery",
+                f"{latest['sensors']['battery_voltage_v']:.2f}V",
+                delta=None
+            )
+        
+        # Anomaly status
+        anomaly_status = "ANOMALY DETECTED" if latest['anomaly'] == -1 else "NORMAL"
+        st.markdown(f"**Status:** {anomaly_status} | **Anomaly Score:** {latest['anomaly_score']:.3f}")
         
-        st.plotly_chart(fig, use_container_width=True)
+        st.markdown("---")
         
-        # Anomalies table
-        if st.session_state.anomalies_detected:
-            st.markdown("### Anomaly History")
-            anomalies_df = pd.DataFrame([
-                {
-                    "Timestamp": a["timestamp"],
-                    "RPM": a["reading"]["sensors"]["engine_rpm"],
-                    "Temp (°C)": a["reading"]["sensors"]["engine_temp_c"],
-                    "Vibration (g)": a["reading"]["sensors"]["vibration_level_g"],
-                    "Anomaly Score": a["reading"]["anomaly_score"]
-                }
-                for a in st.session_state.anomalies_detected[-10:]  # Last 10 anomalies
-            ])
-            st.dataframe(anomalies_df, use_container_width=True)
-else:
-    st.info("Click 'Generate New Reading' or enable 'Auto Update' to start monitoring")
+        # Charts
+        if len(st.session_state.readings_history) > 1:
+            # The chart is built once per session; its trace data is only
+            # replaced when a reading has been recorded since the last draw
+            if "telemetry_figure" not in st.session_state:
+                st.session_state.telemetry_figure = _build_telemetry_figure()
+                st.session_state.chart_stale = True
+            fig = st.session_state.telemetry_figure
+            
+            if st.session_state.chart_stale:
+                df = _history_frame()
+                for trace, column in zip(fig.data, TELEMETRY_TRACE_COLUMNS):
+                    trace.x = df["timestamp"]
+                    trace.y = df[column]
+                fig.data[-1].marker.color = np.where(df["anomaly"].to_numpy() == -1, "red", "green")
+                st.session_state.chart_stale = False
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            # Anomalies table
+            if st.session_state.anomalies_detected:
+                st.markdown("### Anomaly History")
+                anomalies_df = pd.DataFrame([
+                    {
+                        "Timestamp": a["timestamp"],
+                        "RPM": a["reading"]["sensors"]["engine_rpm"],
+                        "Temp (°C)": a["reading"]["sensors"]["engine_temp_c"],
+                        "Vibration (g)": a["reading"]["sensors"]["vibration_level_g"],
+                        "Anomaly Score": a["reading"]["anomaly_score"]
+                    }
+                    for a in st.session_state.anomalies_detected[-10:]  # Last 10 anomalies
+                ])
+                st.dataframe(anomalies_df, use_container_width=True)
+    else:
+        st.info("Click 'Generate New Reading' or enable 'Auto Update' to start monitoring")
+
 
 # ============================================
 # AUTO-REFRESH MECHANISM (at end of page)
 # ============================================
-# This runs AFTER all content is rendered, so dashboard is visible
+# Each tick reruns only the telemetry fragment; the header, sidebar and page
+# routing above are rebuilt on the next full run. The countdown inside it and
+# the sidebar counters refresh every second as fragments of their own.
 if st.session_state.auto_update:
-    import time as time_module
-    
-    # Wait for the update interval, then refresh
-    # Using a shorter sleep to be responsive
-    sleep_time = min(st.session_state.update_interval, 1.0)
-    time_module.sleep(sleep_time)
-    st.rerun()
-
+    st.fragment(run_every=st.session_state.update_interval)(_render_telemetry)()
+else:
+    _render_telemetry()
@@ -379,3 +379,15 @@ def get_risk_level(reading: Dict) -> str:
     else:
         return "Medium"
 
+
+def get_health_summary(reading: Dict) -> Tuple[int, str, str]:
+    """
+    Get the metrics shown on the Vehicle Health Dashboard.
+    
+    Args:
+        reading: Dictionary containing vehicle_id, timestamp, and sensor readings
+        
+    Returns:
+        Tuple of (health_score, predicted_issue, risk_level)
+    """
+    return calculate_health_score(reading), get_predicted_issue(reading), get_risk_level(reading)
@@ -0,0 +1,103 @@
+"""
+Tests for the anomaly detector's inference paths.
+
+They use the trained models saved in the repository and are skipped when
+TensorFlow is not installed.
+"""
+
+import random
+import unittest
+
+try:
+    import tensorflow  # noqa: F401
+    TF_AVAILABLE = True
+except ImportError:
+    TF_AVAILABLE = False
+
+try:
+    import onnxruntime  # noqa: F401
+    import tf2onnx  # noqa: F401
+    ONNX_AVAILABLE = True
+except ImportError:
+    ONNX_AVAILABLE = False
+
+
+def _readings(n: int = 60, seed: int = 0) -> list:
+    """Generate a reproducible run of readings with a fault in the middle."""
+    from vehicle_sim import VehicleSimulator
+    
+    random.seed(seed)
+    simulator = VehicleSimulator()
+    readings = []
+    for i in range(n):
+        simulator.inject_fault("overheat" if n // 2 <= i < n // 2 + 5 else None)
+        readings.append(simulator.generate_reading())
+    return readings
+
+
+@unittest.skipUnless(TF_AVAILABLE, "TensorFlow is not installed")
+class DetectAndScoreTest(unittest.TestCase):
+    """detect_and_score() against detect_anomaly()."""
+    
+    def test_labels_match_detect_anomaly(self):
+        from anomaly_model import AnomalyDetector
+        
+        combined = AnomalyDetector()
+        unscored = AnomalyDetector()
+        single = AnomalyDetector()
+        
+        readings = _readings()
+        expected = [single.detect_anomaly(r) for r in readings]
+        results = [combined.detect_and_score(r) for r in readings]
+        self.assertEqual([label for label, _ in results], expected)
+        self.assertTrue(all(-1.0 <= score <= 0.0 for _, score in results))
+        self.assertEqual(
+            [unscored.detect_and_score(r, with_score=False) for r in readings],
+            [(label, None) for label in expected]
+        )
+
+
+@unittest.skipUnless(TF_AVAILABLE, "TensorFlow is not installed")
+class QuantizedLSTMTest(unittest.TestCase):
+    """The opt-in int8 TFLite LSTM."""
+    
+    def test_interpreter_is_built(self):
+        from anomaly_model import AnomalyDetector
+        
+        detector = AnomalyDetector(quantize_lstm=True)
+        self.assertTrue(detector.is_trained)
+        self.assertIsNotNone(detector._tflite)
+    
+    def test_labels_match_float_model(self):
+        from anomaly_model import AnomalyDetector
+        
+        quantized = AnomalyDetector(quantize_lstm=True)
+        float_model = AnomalyDetector()
+        self.assertIsNotNone(quantized._tflite)
+        self.assertIsNone(float_model._tflite)
+        
+        readings = _readings()
+        self.assertEqual(
+            [quantized.detect_anomaly(r) for r in readings],
+            [float_model.detect_anomaly(r) for r in readings]
+        )
+
+
+@unittest.skipUnless(TF_AVAILABLE and ONNX_AVAILABLE, "TensorFlow or ONNX Runtime is not installed")
+class OnnxLSTMTest(unittest.TestCase):
+    """LSTM inference through ONNX Runtime."""
+    
+    def test_session_matches_tensorflow(self):
+        import numpy as np
+        from anomaly_model import AnomalyDetector
+        
+        detector = AnomalyDetector()
+        self.assertIsNotNone(detector._ort_session)
+        
+        sequence = np.random.default_rng(0).random((detector.sequence_length, 5), dtype=np.float32)
+        expected = detector._lstm_infer(sequence[np.newaxis])[0].numpy()
+        np.testing.assert_allclose(detector._predict_next(sequence), expected, atol=1e-5)
+
+
+if __name__ == "__main__":
+    unittest.main()
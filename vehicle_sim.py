@@ -8,6 +8,52 @@ import random
 import datetime
 from typing import Dict, Optional
 
+import numpy as np
+
+
+# Sensor order used for raw feature matrices
+SENSOR_NAMES = (
+    "engine_rpm",
+    "engine_temp_c",
+    "vibration_level_g",
+    "throttle_pos_pct",
+    "battery_voltage_v"
+)
+
+# Sensor overrides applied while a fault is active: sensor -> (low, high)
+FAULT_OVERRIDES = {
+    # Critical overheating
+    "overheat": {"engine_temp_c": (120, 140)},
+    # Critical vibration
+    "vibration": {"vibration_level_g": (1.5, 2.5)},
+    # Low battery voltage
+    "battery_failure": {"battery_voltage_v": (11.0, 11.8)},
+    # High RPM with low throttle (throttle stuck or malfunctioning)
+    "throttle_malfunction": {
+        "engine_rpm": (3500, 4000),
+        "throttle_pos_pct": (5, 15)
+    },
+    # Irregular RPM patterns (engine misfiring): low, unstable RPM,
+    # increased vibration and lower temp due to misfire
+    "engine_misfire": {
+        "engine_rpm": (800, 1200),
+        "vibration_level_g": (0.6, 0.9),
+        "engine_temp_c": (70, 85)
+    },
+    # Fuel system issues: high throttle but low, struggling RPM
+    "fuel_system": {
+        "engine_rpm": (600, 1000),
+        "throttle_pos_pct": (40, 60),
+        "engine_temp_c": (65, 80)
+    },
+    # Cooling system failure - moderate overheating
+    # (RPM stays on the interconnected system for realism)
+    "cooling_system": {"engine_temp_c": (115, 125)}
+}
+
+# Values accepted by VehicleSimulator.inject_fault (None clears the fault)
+VALID_FAULTS = (None, *FAULT_OVERRIDES)
+
 
 class VehicleSimulator:
     """
@@ -41,9 +87,10 @@ class VehicleSimulator:
         # Target temperature for cooling (ambient/idle temp)
         self.idle_temp = 82.0
         
-    def generate_reading(self) -> Dict:
+    def _advance_state(self, throttle_change: float, rpm_noise: float,
+                       temp_noise: float, vib_noise: float, battery_noise: float):
         """
-        Generate a single telemetry reading with realistic interconnected sensor values.
+        Advance the interconnected sensor state by one tick.
         
         The chain of causation:
         1. Throttle changes (simulates driver input)
@@ -52,18 +99,16 @@ class VehicleSimulator:
         4. Vibration responds to RPM
         5. Battery responds to electrical load
         
-        Returns:
-            Dictionary containing vehicle_id, timestamp, and sensor readings
+        Args:
+            throttle_change: Change in driver throttle input (%)
+            rpm_noise: Random RPM variation
+            temp_noise: Random temperature variation (°C)
+            vib_noise: Random vibration variation (g)
+            battery_noise: Random battery voltage variation (V)
         """
         # ============================================
         # STEP 1: Throttle Position (Driver Input)
         # ============================================
-        # Simulate realistic driving: gradual changes with occasional quick moves
-        if random.random() < 0.1:  # 10% chance of bigger throttle change
-            throttle_change = random.uniform(-20, 20)
-        else:
-            throttle_change = random.uniform(-8, 8)
-        
         self.throttle = max(0, min(100, self.throttle + throttle_change))
         
         # ============================================
@@ -74,9 +119,7 @@ class VehicleSimulator:
         target_rpm = 800 + (self.throttle / 100) * 2700
         
         # RPM moves toward target with some lag (engine response time)
-        # Add small random variation for realism
         rpm_response_rate = 0.3  # How quickly RPM responds (0-1)
-        rpm_noise = random.uniform(-50, 50)
         self.rpm = self.rpm + (target_rpm - self.rpm) * rpm_response_rate + rpm_noise
         self.rpm = max(750, min(3500, self.rpm))
         
@@ -85,13 +128,15 @@ class VehicleSimulator:
         # ============================================
         # Higher RPM generates more heat, idle/low RPM allows cooling
         # Heat generation is proportional to RPM^2 (power output)
-        heat_generation = ((self.rpm - 800) / 2700) ** 1.5 * 0.8  # 0 to 0.8 scale
+        # (RPM can dip below 800 at idle, which generates no heat; unclamped, the
+        # fractional power of a negative base is a complex number)
+        heat_generation = max(0.0, (self.rpm - 800) / 2700) ** 1.5 * 0.8  # 0 to 0.8 scale
         
         # Cooling is proportional to how much above ambient we are
         cooling_rate = (self.temperature - self.idle_temp) * 0.05
         
         # Net temperature change
-        temp_change = heat_generation - cooling_rate + random.uniform(-0.5, 0.5)
+        temp_change = heat_generation - cooling_rate + temp_noise
         self.temperature = self.temperature + temp_change
         
         # Clamp to realistic range (ambient to slightly warm)
@@ -104,7 +149,6 @@ class VehicleSimulator:
         # Also slight increase with throttle (engine load)
         base_vib = 0.08 + (self.rpm / 3500) * 0.25  # 0.08g at idle, up to 0.33g at high RPM
         load_vib = (self.throttle / 100) * 0.05  # Additional vibration from load
-        vib_noise = random.uniform(-0.02, 0.02)
         
         self.vibration = base_vib + load_vib + vib_noise
         self.vibration = max(0.05, min(0.40, self.vibration))
@@ -116,60 +160,107 @@ class VehicleSimulator:
         # Higher electrical load (throttle as proxy) = slight drain
         alternator_output = 13.5 + (self.rpm / 3500) * 1.3  # 13.5V at idle, 14.8V at high RPM
         electrical_load = (self.throttle / 100) * 0.3  # Load from accessories
-        battery_noise = random.uniform(-0.05, 0.05)
         
         target_battery = alternator_output - electrical_load
         self.battery = self.battery + (target_battery - self.battery) * 0.2 + battery_noise
         self.battery = max(13.2, min(14.8, self.battery))
+    
+    def generate_reading(self) -> Dict:
+        """
+        Generate a single telemetry reading with realistic interconnected sensor values.
+        
+        Returns:
+            Dictionary containing vehicle_id, timestamp, and sensor readings
+        """
+        # Simulate realistic driving: gradual changes with occasional quick moves
+        if random.random() < 0.1:  # 10% chance of bigger throttle change
+            throttle_change = random.uniform(-20, 20)
+        else:
+            throttle_change = random.uniform(-8, 8)
+        
+        self._advance_state(
+            throttle_change,
+            rpm_noise=random.uniform(-50, 50),
+            temp_noise=random.uniform(-0.5, 0.5),
+            vib_noise=random.uniform(-0.02, 0.02),
+            battery_noise=random.uniform(-0.05, 0.05)
+        )
         
         # Start with the interconnected normal values
-        final_rpm = self.rpm
-        final_temp = self.temperature
-        final_vibration = self.vibration
-        final_throttle = self.throttle
-        final_battery = self.battery
+        sensors = {
+            "engine_rpm": self.rpm,
+            "engine_temp_c": self.temperature,
+            "vibration_level_g": self.vibration,
+            "throttle_pos_pct": self.throttle,
+            "battery_voltage_v": self.battery
+        }
         
         # Apply fault injection if active (override specific values)
-        if self.fault_type == "overheat":
-            final_temp = random.uniform(120, 140)  # Critical overheating
-        elif self.fault_type == "vibration":
-            final_vibration = random.uniform(1.5, 2.5)  # Critical vibration
-        elif self.fault_type == "battery_failure":
-            final_battery = random.uniform(11.0, 11.8)  # Low battery voltage
-        elif self.fault_type == "throttle_malfunction":
-            # High RPM with low throttle (throttle stuck or malfunctioning)
-            final_rpm = random.uniform(3500, 4000)
-            final_throttle = random.uniform(5, 15)  # Low throttle despite high RPM
-        elif self.fault_type == "engine_misfire":
-            # Irregular RPM patterns (engine misfiring)
-            final_rpm = random.uniform(800, 1200)  # Low, unstable RPM
-            final_vibration = random.uniform(0.6, 0.9)  # Increased vibration
-            final_temp = random.uniform(70, 85)  # Lower temp due to misfire
-        elif self.fault_type == "fuel_system":
-            # Fuel system issues - affects RPM and throttle response
-            final_rpm = random.uniform(600, 1000)  # Low RPM, struggling
-            final_throttle = random.uniform(40, 60)  # High throttle but low RPM
-            final_temp = random.uniform(65, 80)  # Lower temp
-        elif self.fault_type == "cooling_system":
-            # Cooling system failure - gradual overheating
-            final_temp = random.uniform(115, 125)  # Moderate overheating
-            # Keep RPM from interconnected system for realism
+        for sensor, (low, high) in FAULT_OVERRIDES.get(self.fault_type, {}).items():
+            sensors[sensor] = random.uniform(low, high)
         
         # Create reading with interconnected values
         reading = {
             "vehicle_id": self.vehicle_id,
             "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "sensors": {
-                "engine_rpm": round(final_rpm, 2),
-                "engine_temp_c": round(final_temp, 2),
-                "vibration_level_g": round(final_vibration, 3),
-                "throttle_pos_pct": int(final_throttle),
-                "battery_voltage_v": round(final_battery, 2)
+                "engine_rpm": round(sensors["engine_rpm"], 2),
+                "engine_temp_c": round(sensors["engine_temp_c"], 2),
+                "vibration_level_g": round(sensors["vibration_level_g"], 3),
+                "throttle_pos_pct": int(sensors["throttle_pos_pct"]),
+                "battery_voltage_v": round(sensors["battery_voltage_v"], 2)
             }
         }
         
         return reading
     
+    def generate_readings_batch(self, n: int) -> np.ndarray:
+        """
+        Generate n consecutive readings as a raw sensor matrix.
+        
+        Follows the same physical model and fault overrides as generate_reading(),
+        but draws all noise up front and skips building a dictionary and
+        timestamp per reading. Intended for bulk generation of training data.
+        The noise generator is seeded from the random module, so random.seed()
+        makes batches reproducible just like single readings.
+        
+        Args:
+            n: Number of readings to generate
+            
+        Returns:
+            float32 array of shape (n, 5), columns ordered as SENSOR_NAMES
+        """
+        rng = np.random.default_rng(random.getrandbits(64))
+        big_move = rng.random(n) < 0.1  # 10% chance of bigger throttle change
+        throttle_change = np.where(big_move, rng.uniform(-20, 20, n), rng.uniform(-8, 8, n))
+        noise = zip(
+            throttle_change.tolist(),
+            rng.uniform(-50, 50, n).tolist(),
+            rng.uniform(-0.5, 0.5, n).tolist(),
+            rng.uniform(-0.02, 0.02, n).tolist(),
+            rng.uniform(-0.05, 0.05, n).tolist()
+        )
+        
+        # The state recurrence is inherently sequential; only the cheap
+        # arithmetic update stays inside the loop
+        data = np.empty((n, 5), dtype=np.float32)
+        for i, tick_noise in enumerate(noise):
+            self._advance_state(*tick_noise)
+            data[i] = (self.rpm, self.temperature, self.vibration, self.throttle, self.battery)
+        
+        # Apply fault injection if active (override whole columns at once)
+        for sensor, (low, high) in FAULT_OVERRIDES.get(self.fault_type, {}).items():
+            data[:, SENSOR_NAMES.index(sensor)] = rng.uniform(low, high, n)
+        
+        # Match the precision of generate_reading()
+        data[:, 0] = np.round(data[:, 0], 2)
+        data[:, 1] = np.round(data[:, 1], 2)
+        data[:, 2] = np.round(data[:, 2], 3)
+        data[:, 3] = np.trunc(data[:, 3])
+        data[:, 4] = np.round(data[:, 4], 2)
+        
+        return data
+    
     def inject_fault(self, fault_type: Optional[str] = None):
         """
         Inject a simulated fault into the sensor readings.
@@ -185,11 +276,8 @@ class VehicleSimulator:
                 - "cooling_system": Moderate overheating (cooling system failure)
                 - None: Clears any active fault (normal operation)
         """
-        valid_faults = [None, "overheat", "vibration", "battery_failure", 
-                       "throttle_malfunction", "engine_misfire", 
-                       "fuel_system", "cooling_system"]
-        if fault_type not in valid_faults:
-            raise ValueError(f"Unknown fault type: {fault_type}. Valid options: {valid_faults}")
+        if fault_type not in VALID_FAULTS:
+            raise ValueError(f"Unknown fault type: {fault_type}. Valid options: {list(VALID_FAULTS)}")
         
         self.fault_type = fault_type
     